@@ -7,27 +7,27 @@
 -- =============================================================================
 
 CREATE TABLE ref_issuer_type (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(50) NOT NULL
 );
 
 CREATE TABLE ref_issuer_status (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(50) NOT NULL
 );
 
 CREATE TABLE ref_issuer_transaction (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(100) NOT NULL
 );
 
 CREATE TABLE ref_issue_status (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(50) NOT NULL
 );
 
 CREATE TABLE ref_issue_transaction (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(100) NOT NULL
 );
 
@@ -37,17 +37,17 @@ CREATE TABLE ref_govt_stimulus_program (
 );
 
 CREATE TABLE ref_payment_frequency (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(50) NOT NULL
 );
 
 CREATE TABLE ref_sale_type (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(50) NOT NULL
 );
 
 CREATE TABLE ref_offering_amount_code (
-    code        VARCHAR(1) PRIMARY KEY,
+    code        "char" PRIMARY KEY,
     description VARCHAR(50) NOT NULL
 );
 
@@ -66,12 +66,19 @@ CREATE TABLE issuer (
     issuer_adl_3        VARCHAR(30),
     issuer_adl_4        VARCHAR(30),
     issuer_sort_key     VARCHAR(30),
-    issuer_type         VARCHAR(1),
-    issuer_status       VARCHAR(1),
+    issuer_type         "char",
+    issuer_status       "char",
     issuer_del_date     DATE,
-    issuer_transaction  VARCHAR(1),
+    issuer_transaction  "char",
     issuer_state_code   VARCHAR(2),
     issuer_update_date  DATE,
+    issuer_name_full    VARCHAR(90) GENERATED ALWAYS AS (
+        TRIM(
+            COALESCE(issuer_name_1, '') ||
+            COALESCE(issuer_name_2, '') ||
+            COALESCE(issuer_name_3, '')
+        )
+    ) STORED,
 
     CONSTRAINT pk_issuer PRIMARY KEY (issuer_num),
     CONSTRAINT fk_issuer_type FOREIGN KEY (issuer_type)
@@ -92,14 +99,20 @@ CREATE TABLE issue (
     issue_adl_2             VARCHAR(30),
     issue_adl_3             VARCHAR(30),
     issue_adl_4             VARCHAR(30),
-    issue_status            VARCHAR(1),
+    issue_status            "char",
     dated_date              DATE,
     maturity_date           DATE,
     partial_maturity        INTEGER,
     rate                    DECIMAL(6,3),
     govt_stimulus_program   VARCHAR(10),
-    issue_transaction       VARCHAR(1),
+    issue_transaction       "char",
     issue_update_date       DATE,
+    cusip                   VARCHAR(9) GENERATED ALWAYS AS (
+        issuer_num || issue_num || COALESCE(issue_check, '')
+    ) STORED,
+    issue_description_full  VARCHAR(60) GENERATED ALWAYS AS (
+        TRIM(COALESCE(issue_desc_1, '') || COALESCE(issue_desc_2, ''))
+    ) STORED,
 
     CONSTRAINT pk_issue PRIMARY KEY (issuer_num, issue_num),
     CONSTRAINT fk_issue_issuer FOREIGN KEY (issuer_num)
@@ -110,31 +123,44 @@ CREATE TABLE issue (
         REFERENCES ref_issue_transaction(code),
     CONSTRAINT fk_issue_govt_stimulus FOREIGN KEY (govt_stimulus_program)
         REFERENCES ref_govt_stimulus_program(code)
-);
+) WITH (fillfactor = 90);
 
+-- Columns grouped by alignment (DATEs, numeric, "char", short then long text)
+-- so rows carry as little padding as possible
 CREATE TABLE issue_attribute (
     issuer_num              VARCHAR(6) NOT NULL,
     issue_num               VARCHAR(2) NOT NULL,
-    alternative_min_tax     VARCHAR(1),
-    bank_q                  VARCHAR(1),
-    callable                VARCHAR(1),
     activity_date           DATE,
     first_coupon_date       DATE,
-    init_pub_off            VARCHAR(1),
-    payment_frequency       VARCHAR(1),
-    currency_code           VARCHAR(3),
+    closing_date            DATE,
+    municipal_sale_date     DATE,
+    offering_amount         DECIMAL(5,1),
+    offering_amount_full    DECIMAL(18,1) GENERATED ALWAYS AS (
+        offering_amount * CASE offering_amount_code
+            WHEN 'K' THEN 1000
+            WHEN 'M' THEN 1000000
+            WHEN 'B' THEN 1000000000
+            ELSE 1
+        END
+    ) STORED,
+    alternative_min_tax     "char",
+    bank_q                  "char",
+    callable                "char",
+    init_pub_off            "char",
+    depos_eligible          "char",
+    pre_refund              "char",
+    refundable              "char",
+    remarketed              "char",
+    sinking_fund            "char",
+    taxable                 "char",
+    payment_frequency       "char",
+    sale_type               "char",
+    offering_amount_code    "char",
     domicile_code           VARCHAR(2),
-    underwriter             VARCHAR(60),
+    currency_code           VARCHAR(3),
     us_cfi_code             VARCHAR(6),
-    closing_date            DATE,
-    ticker_symbol           VARCHAR(10),
     iso_cfi                 VARCHAR(6),
-    depos_eligible          VARCHAR(1),
-    pre_refund              VARCHAR(1),
-    refundable              VARCHAR(1),
-    remarketed              VARCHAR(1),
-    sinking_fund            VARCHAR(1),
-    taxable                 VARCHAR(1),
+    ticker_symbol           VARCHAR(10),
     form                    VARCHAR(50),
     enhancements            VARCHAR(50),
     fund_distrb_policy      VARCHAR(50),
@@ -156,16 +182,13 @@ CREATE TABLE issue_attribute (
     warrant_status          VARCHAR(50),
     warrant_type            VARCHAR(50),
     where_traded            VARCHAR(50),
+    underwriter             VARCHAR(60),
     auditor                 VARCHAR(60),
     paying_agent            VARCHAR(60),
     tender_agent            VARCHAR(60),
     xfer_agent              VARCHAR(60),
     bond_counsel            VARCHAR(60),
     financial_advisor       VARCHAR(60),
-    municipal_sale_date     DATE,
-    sale_type               VARCHAR(1),
-    offering_amount         DECIMAL(5,1),
-    offering_amount_code    VARCHAR(1),
 
     CONSTRAINT pk_issue_attribute PRIMARY KEY (issuer_num, issue_num),
     CONSTRAINT fk_issue_attr_issue FOREIGN KEY (issuer_num, issue_num)
@@ -176,13 +199,18 @@ CREATE TABLE issue_attribute (
         REFERENCES ref_sale_type(code),
     CONSTRAINT fk_issue_attr_offering_code FOREIGN KEY (offering_amount_code)
         REFERENCES ref_offering_amount_code(code)
-);
+) WITH (fillfactor = 90);
+
+-- Record the join-key order so a plain "CLUSTER issue" after a large load
+-- re-sorts the heap for the issue -> issue_attribute join
+ALTER TABLE issue CLUSTER ON pk_issue;
+ALTER TABLE issue_attribute CLUSTER ON pk_issue_attribute;
 
 -- =============================================================================
--- STAGING TABLES (no constraints, for bulk loading)
+-- STAGING TABLES (unlogged, no constraints, no autovacuum, for bulk loading)
 -- =============================================================================
 
-CREATE TABLE stg_issuer (
+CREATE UNLOGGED TABLE stg_issuer (
     issuer_num          VARCHAR(6),
     issuer_check        VARCHAR(1),
     issuer_name_1       VARCHAR(30),
@@ -199,9 +227,9 @@ CREATE TABLE stg_issuer (
     issuer_transaction  VARCHAR(1),
     issuer_state_code   VARCHAR(2),
     issuer_update_date  DATE
-);
+) WITH (autovacuum_enabled = false);
 
-CREATE TABLE stg_issue (
+CREATE UNLOGGED TABLE stg_issue (
     issuer_num              VARCHAR(6),
     issue_num               VARCHAR(2),
     issue_check             VARCHAR(1),
@@ -219,9 +247,9 @@ CREATE TABLE stg_issue (
     govt_stimulus_program   VARCHAR(10),
     issue_transaction       VARCHAR(1),
     issue_update_date       DATE
-);
+) WITH (autovacuum_enabled = false);
 
-CREATE TABLE stg_issue_attribute (
+CREATE UNLOGGED TABLE stg_issue_attribute (
     issuer_num              VARCHAR(6),
     issue_num               VARCHAR(2),
     alternative_min_tax     VARCHAR(1),
@@ -275,7 +303,7 @@ CREATE TABLE stg_issue_attribute (
     sale_type               VARCHAR(1),
     offering_amount         DECIMAL(5,1),
     offering_amount_code    VARCHAR(1)
-);
+) WITH (autovacuum_enabled = false);
 
 -- =============================================================================
 -- INDEXES
@@ -284,11 +312,21 @@ CREATE TABLE stg_issue_attribute (
 CREATE INDEX idx_issuer_status ON issuer(issuer_status);
 CREATE INDEX idx_issuer_type ON issuer(issuer_type);
 CREATE INDEX idx_issuer_state ON issuer(issuer_state_code);
+CREATE INDEX idx_issuer_update_brin ON issuer
+    USING BRIN (issuer_update_date) WITH (pages_per_range = 32);
 
 CREATE INDEX idx_issue_status ON issue(issue_status);
 CREATE INDEX idx_issue_maturity ON issue(maturity_date);
 CREATE INDEX idx_issue_dated ON issue(dated_date);
+CREATE UNIQUE INDEX idx_issue_cusip ON issue(cusip);
+CREATE INDEX idx_issue_update_brin ON issue
+    USING BRIN (issue_update_date) WITH (pages_per_range = 32);
 
 CREATE INDEX idx_issue_attr_currency ON issue_attribute(currency_code);
 CREATE INDEX idx_issue_attr_domicile ON issue_attribute(domicile_code);
 CREATE INDEX idx_issue_attr_ticker ON issue_attribute(ticker_symbol);
+CREATE INDEX idx_issue_attr_offering_amount ON issue_attribute(offering_amount_full);
+CREATE INDEX idx_issue_attr_summary ON issue_attribute(issuer_num, issue_num)
+    INCLUDE (ticker_symbol, currency_code, where_traded);
+CREATE INDEX idx_issue_attr_activity_brin ON issue_attribute
+    USING BRIN (activity_date) WITH (pages_per_range = 32);
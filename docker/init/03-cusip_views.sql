@@ -6,7 +6,7 @@ CREATE OR REPLACE VIEW v_issuer AS
 SELECT
     i.issuer_num,
     i.issuer_check,
-    TRIM(CONCAT(i.issuer_name_1, i.issuer_name_2, i.issuer_name_3)) AS issuer_name,
+    i.issuer_name_full AS issuer_name,
     TRIM(CONCAT(i.issuer_adl_1, i.issuer_adl_2, i.issuer_adl_3, i.issuer_adl_4)) AS issuer_additional_info,
     i.issuer_sort_key,
     i.issuer_type,
@@ -27,9 +27,9 @@ CREATE OR REPLACE VIEW v_issue AS
 SELECT
     i.issuer_num,
     i.issue_num,
-    CONCAT(i.issuer_num, i.issue_num, i.issue_check) AS cusip,
+    i.cusip,
     i.issue_check,
-    TRIM(CONCAT(i.issue_desc_1, i.issue_desc_2)) AS issue_description,
+    i.issue_description_full AS issue_description,
     TRIM(CONCAT(i.issue_adl_1, i.issue_adl_2, i.issue_adl_3, i.issue_adl_4)) AS issue_additional_info,
     i.issue_status,
     rs.description AS issue_status_desc,
@@ -106,12 +106,7 @@ SELECT
     ia.offering_amount,
     ia.offering_amount_code,
     roa.description AS offering_amount_code_desc,
-    CASE ia.offering_amount_code
-        WHEN 'K' THEN ia.offering_amount * 1000
-        WHEN 'M' THEN ia.offering_amount * 1000000
-        WHEN 'B' THEN ia.offering_amount * 1000000000
-        ELSE ia.offering_amount
-    END AS offering_amount_full
+    ia.offering_amount_full
 FROM issue_attribute ia
 LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
 LEFT JOIN ref_sale_type rst ON ia.sale_type = rst.code
@@ -119,17 +114,17 @@ LEFT JOIN ref_offering_amount_code roa ON ia.offering_amount_code = roa.code;
 
 CREATE OR REPLACE VIEW v_security AS
 SELECT
-    CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check) AS cusip,
+    iss.cusip,
     iss.issuer_num,
     iss.issue_num,
     iss.issue_check,
-    TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)) AS issuer_name,
+    isr.issuer_name_full AS issuer_name,
     isr.issuer_type,
     rit.description AS issuer_type_desc,
     isr.issuer_status,
     ris.description AS issuer_status_desc,
     isr.issuer_state_code,
-    TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)) AS issue_description,
+    iss.issue_description_full AS issue_description,
     TRIM(CONCAT(iss.issue_adl_1, iss.issue_adl_2, iss.issue_adl_3, iss.issue_adl_4)) AS issue_additional_info,
     iss.issue_status,
     rss.description AS issue_status_desc,
@@ -160,12 +155,7 @@ SELECT
     ia.underwriter,
     ia.offering_amount,
     ia.offering_amount_code,
-    CASE ia.offering_amount_code
-        WHEN 'K' THEN ia.offering_amount * 1000
-        WHEN 'M' THEN ia.offering_amount * 1000000
-        WHEN 'B' THEN ia.offering_amount * 1000000000
-        ELSE ia.offering_amount
-    END AS offering_amount_full,
+    ia.offering_amount_full,
     ia.activity_date,
     ia.first_coupon_date,
     ia.closing_date,
@@ -183,9 +173,9 @@ LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code;
 
 CREATE OR REPLACE VIEW v_security_summary AS
 SELECT
-    CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check) AS cusip,
-    TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)) AS issuer_name,
-    TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)) AS issue_description,
+    iss.cusip,
+    isr.issuer_name_full AS issuer_name,
+    iss.issue_description_full AS issue_description,
     ia.ticker_symbol,
     rit.description AS issuer_type,
     rss.description AS issue_status,
@@ -200,3 +190,33 @@ LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
                              AND iss.issue_num = ia.issue_num
 LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
 LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code;
+
+-- =============================================================================
+-- Materialized security summary (refreshed by the loader after each load)
+-- =============================================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_security_summary AS
+SELECT
+    iss.cusip,
+    isr.issuer_name_full AS issuer_name,
+    iss.issue_description_full AS issue_description,
+    ia.ticker_symbol,
+    rit.description AS issuer_type,
+    rss.description AS issue_status,
+    iss.rate,
+    iss.dated_date,
+    iss.maturity_date,
+    ia.currency_code,
+    ia.where_traded
+FROM issue iss
+INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                             AND iss.issue_num = ia.issue_num
+LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_security_summary_cusip
+    ON mv_security_summary(cusip);
+CREATE INDEX IF NOT EXISTS idx_mv_security_summary_search ON mv_security_summary
+    USING GIN (to_tsvector('english', issuer_name || ' ' || issue_description))
+    WITH (fastupdate = off);
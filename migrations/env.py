@@ -26,16 +26,40 @@ target_metadata = None
 
 def get_db_url() -> str:
     """Build database URL from settings with proper encoding."""
-    settings = get_settings()
+    # db_config resolves Secrets Manager credentials when configured
+    db_config = get_settings().db_config
     # URL-encode password to handle special characters (@, #, %, etc.)
-    encoded_password = quote_plus(settings.db_password)
+    encoded_password = quote_plus(db_config["password"])
     return (
-        f"postgresql://{settings.db_user}:{encoded_password}"
-        f"@{settings.db_host}:{settings.db_port}/{settings.db_name}"
-        f"?sslmode={settings.db_sslmode}"
+        f"postgresql://{db_config['user']}:{encoded_password}"
+        f"@{db_config['host']}:{db_config['port']}/{db_config['dbname']}"
+        f"?sslmode={db_config.get('sslmode', 'prefer')}"
     )
 
 
+# -x settings a migration run can raise for the revisions that build indexes
+# or run CLUSTER, e.g. "alembic -x maintenance_work_mem=2GB upgrade head"
+MAINTENANCE_SETTINGS = ("maintenance_work_mem", "max_parallel_maintenance_workers")
+
+
+def configure_maintenance_session() -> None:
+    """Expose opt-in SET LOCAL statements to index-building revisions.
+
+    Nothing is raised by default: the server settings are sized for the
+    instance, and a migration that only swaps a view has no use for 2GB of
+    sort memory. Revisions that build indexes or run CLUSTER execute the
+    statements in config.attributes["maintenance_session"] first; SET LOCAL
+    only lasts until the migration transaction ends.
+    """
+    x_args = context.get_x_argument(as_dictionary=True)
+    statements = []
+    for name in MAINTENANCE_SETTINGS:
+        if value := x_args.get(name):
+            quoted = value.replace("'", "''")
+            statements.append(f"SET LOCAL {name} = '{quoted}'")
+    config.attributes["maintenance_session"] = statements
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -78,6 +102,8 @@ def run_migrations_online() -> None:
             context.run_migrations()
 
 
+configure_maintenance_session()
+
 if context.is_offline_mode():
     run_migrations_offline()
 else:
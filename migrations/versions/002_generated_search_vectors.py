@@ -0,0 +1,169 @@
+"""Replace plpgsql search-vector triggers with generated tsvector columns.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # ==========================================================================
+    # DROP FULL-TEXT SEARCH TRIGGERS
+    # ==========================================================================
+    op.execute("DROP TRIGGER IF EXISTS issue_attr_search_trigger ON issue_attribute")
+    op.execute("DROP TRIGGER IF EXISTS issue_search_trigger ON issue")
+    op.execute("DROP TRIGGER IF EXISTS issuer_search_trigger ON issuer")
+
+    op.execute("DROP FUNCTION IF EXISTS update_issue_attr_search_vector()")
+    op.execute("DROP FUNCTION IF EXISTS update_issue_search_vector()")
+    op.execute("DROP FUNCTION IF EXISTS update_issuer_search_vector()")
+
+    # ==========================================================================
+    # GENERATED SEARCH VECTORS
+    # ==========================================================================
+    # Dropping the plain column also drops its GIN index
+    op.execute("ALTER TABLE issuer DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issuer ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector('english',
+                    COALESCE(issuer_name_1, '') || ' ' ||
+                    COALESCE(issuer_name_2, '') || ' ' ||
+                    COALESCE(issuer_name_3, '') || ' ' ||
+                    COALESCE(issuer_sort_key, '')
+                )
+            ) STORED
+    """)
+
+    op.execute("ALTER TABLE issue DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issue ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector('english',
+                    COALESCE(issue_desc_1, '') || ' ' ||
+                    COALESCE(issue_desc_2, '') || ' ' ||
+                    COALESCE(issue_adl_1, '') || ' ' ||
+                    COALESCE(issue_adl_2, '')
+                )
+            ) STORED
+    """)
+
+    op.execute("ALTER TABLE issue_attribute DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issue_attribute ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector('english',
+                    COALESCE(ticker_symbol, '') || ' ' ||
+                    COALESCE(underwriter, '')
+                )
+            ) STORED
+    """)
+
+    op.execute("CREATE INDEX idx_issuer_search ON issuer USING GIN(search_vector)")
+    op.execute("CREATE INDEX idx_issue_search ON issue USING GIN(search_vector)")
+    op.execute(
+        "CREATE INDEX idx_issue_attr_search ON issue_attribute USING GIN(search_vector)"
+    )
+
+
+def downgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # Restore plain tsvector columns (drops the GIN indexes with them)
+    op.execute("ALTER TABLE issue_attribute DROP COLUMN search_vector")
+    op.execute("ALTER TABLE issue_attribute ADD COLUMN search_vector tsvector")
+    op.execute("ALTER TABLE issue DROP COLUMN search_vector")
+    op.execute("ALTER TABLE issue ADD COLUMN search_vector tsvector")
+    op.execute("ALTER TABLE issuer DROP COLUMN search_vector")
+    op.execute("ALTER TABLE issuer ADD COLUMN search_vector tsvector")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_issuer_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('english',
+                COALESCE(NEW.issuer_name_1, '') || ' ' ||
+                COALESCE(NEW.issuer_name_2, '') || ' ' ||
+                COALESCE(NEW.issuer_name_3, '') || ' ' ||
+                COALESCE(NEW.issuer_sort_key, '')
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_issue_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('english',
+                COALESCE(NEW.issue_desc_1, '') || ' ' ||
+                COALESCE(NEW.issue_desc_2, '') || ' ' ||
+                COALESCE(NEW.issue_adl_1, '') || ' ' ||
+                COALESCE(NEW.issue_adl_2, '')
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_issue_attr_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('english',
+                COALESCE(NEW.ticker_symbol, '') || ' ' ||
+                COALESCE(NEW.underwriter, '')
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE TRIGGER issuer_search_trigger
+            BEFORE INSERT OR UPDATE ON issuer
+            FOR EACH ROW EXECUTE FUNCTION update_issuer_search_vector()
+    """)
+
+    op.execute("""
+        CREATE TRIGGER issue_search_trigger
+            BEFORE INSERT OR UPDATE ON issue
+            FOR EACH ROW EXECUTE FUNCTION update_issue_search_vector()
+    """)
+
+    op.execute("""
+        CREATE TRIGGER issue_attr_search_trigger
+            BEFORE INSERT OR UPDATE ON issue_attribute
+            FOR EACH ROW EXECUTE FUNCTION update_issue_attr_search_vector()
+    """)
+
+    # Backfill existing rows through the restored triggers
+    op.execute("UPDATE issuer SET search_vector = NULL")
+    op.execute("UPDATE issue SET search_vector = NULL")
+    op.execute("UPDATE issue_attribute SET search_vector = NULL")
+
+    op.execute("CREATE INDEX idx_issuer_search ON issuer USING GIN(search_vector)")
+    op.execute("CREATE INDEX idx_issue_search ON issue USING GIN(search_vector)")
+    op.execute(
+        "CREATE INDEX idx_issue_attr_search ON issue_attribute USING GIN(search_vector)"
+    )
@@ -0,0 +1,216 @@
+"""Weight search vectors per entity and rank search results once.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # ==========================================================================
+    # WEIGHTED SEARCH VECTORS (issuer = A, issue = B, attribute = C)
+    # ==========================================================================
+    op.execute("ALTER TABLE issuer DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issuer ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english',
+                    COALESCE(issuer_name_1, '') || ' ' ||
+                    COALESCE(issuer_name_2, '') || ' ' ||
+                    COALESCE(issuer_name_3, '') || ' ' ||
+                    COALESCE(issuer_sort_key, '')
+                ), 'A')
+            ) STORED
+    """)
+
+    op.execute("ALTER TABLE issue DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issue ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english',
+                    COALESCE(issue_desc_1, '') || ' ' ||
+                    COALESCE(issue_desc_2, '') || ' ' ||
+                    COALESCE(issue_adl_1, '') || ' ' ||
+                    COALESCE(issue_adl_2, '')
+                ), 'B')
+            ) STORED
+    """)
+
+    op.execute("ALTER TABLE issue_attribute DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issue_attribute ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english',
+                    COALESCE(ticker_symbol, '') || ' ' ||
+                    COALESCE(underwriter, '')
+                ), 'C')
+            ) STORED
+    """)
+
+    op.execute("CREATE INDEX idx_issuer_search ON issuer USING GIN(search_vector)")
+    op.execute("CREATE INDEX idx_issue_search ON issue USING GIN(search_vector)")
+    op.execute(
+        "CREATE INDEX idx_issue_attr_search ON issue_attribute USING GIN(search_vector)"
+    )
+
+    # ==========================================================================
+    # SEARCH FUNCTION
+    # ==========================================================================
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+        BEGIN
+            RETURN QUERY
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check)::varchar(9),
+                TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)),
+                TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)),
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ q.tq THEN 'issuer'
+                    WHEN iss.search_vector @@ q.tq THEN 'issue'
+                    ELSE 'attribute'
+                END,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+               OR iss.search_vector @@ q.tq
+               OR ia.search_vector @@ q.tq
+            ORDER BY search_rank DESC;
+        END;
+        $$ LANGUAGE plpgsql STABLE
+    """)
+
+
+def downgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+        BEGIN
+            RETURN QUERY
+            SELECT
+                CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check)::varchar(9),
+                TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)),
+                TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)),
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ plainto_tsquery('english', search_query)
+                        THEN 'issuer'
+                    WHEN iss.search_vector @@ plainto_tsquery('english', search_query)
+                        THEN 'issue'
+                    WHEN ia.search_vector @@ plainto_tsquery('english', search_query)
+                        THEN 'attribute'
+                END,
+                GREATEST(
+                    ts_rank(isr.search_vector, plainto_tsquery('english', search_query)),
+                    ts_rank(iss.search_vector, plainto_tsquery('english', search_query)),
+                    COALESCE(
+                        ts_rank(ia.search_vector, plainto_tsquery('english', search_query)),
+                        0
+                    )
+                )
+            FROM issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ plainto_tsquery('english', search_query)
+               OR iss.search_vector @@ plainto_tsquery('english', search_query)
+               OR ia.search_vector @@ plainto_tsquery('english', search_query)
+            ORDER BY rank DESC;
+        END;
+        $$ LANGUAGE plpgsql STABLE
+    """)
+
+    # Restore unweighted generated vectors (drops the GIN indexes with them)
+    op.execute("ALTER TABLE issue_attribute DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issue_attribute ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector('english',
+                    COALESCE(ticker_symbol, '') || ' ' ||
+                    COALESCE(underwriter, '')
+                )
+            ) STORED
+    """)
+
+    op.execute("ALTER TABLE issue DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issue ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector('english',
+                    COALESCE(issue_desc_1, '') || ' ' ||
+                    COALESCE(issue_desc_2, '') || ' ' ||
+                    COALESCE(issue_adl_1, '') || ' ' ||
+                    COALESCE(issue_adl_2, '')
+                )
+            ) STORED
+    """)
+
+    op.execute("ALTER TABLE issuer DROP COLUMN search_vector")
+    op.execute("""
+        ALTER TABLE issuer ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector('english',
+                    COALESCE(issuer_name_1, '') || ' ' ||
+                    COALESCE(issuer_name_2, '') || ' ' ||
+                    COALESCE(issuer_name_3, '') || ' ' ||
+                    COALESCE(issuer_sort_key, '')
+                )
+            ) STORED
+    """)
+
+    op.execute("CREATE INDEX idx_issuer_search ON issuer USING GIN(search_vector)")
+    op.execute("CREATE INDEX idx_issue_search ON issue USING GIN(search_vector)")
+    op.execute(
+        "CREATE INDEX idx_issue_attr_search ON issue_attribute USING GIN(search_vector)"
+    )
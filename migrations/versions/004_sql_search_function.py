@@ -0,0 +1,110 @@
+"""Rewrite search_securities as an inlinable SQL-language function.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check)::varchar(9),
+                TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)),
+                TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)),
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ q.tq THEN 'issuer'
+                    WHEN iss.search_vector @@ q.tq THEN 'issue'
+                    ELSE 'attribute'
+                END,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+               OR iss.search_vector @@ q.tq
+               OR ia.search_vector @@ q.tq
+            ORDER BY search_rank DESC
+        $$ LANGUAGE sql STABLE PARALLEL SAFE
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+        BEGIN
+            RETURN QUERY
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check)::varchar(9),
+                TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)),
+                TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)),
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ q.tq THEN 'issuer'
+                    WHEN iss.search_vector @@ q.tq THEN 'issue'
+                    ELSE 'attribute'
+                END,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+               OR iss.search_vector @@ q.tq
+               OR ia.search_vector @@ q.tq
+            ORDER BY search_rank DESC;
+        END;
+        $$ LANGUAGE plpgsql STABLE
+    """)
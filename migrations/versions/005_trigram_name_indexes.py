@@ -0,0 +1,51 @@
+"""Add trigram GIN indexes for substring search on issuer names and issue descriptions.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # ==========================================================================
+    # TRIGRAM INDEXES (ILIKE '%...%' on names and descriptions)
+    # ==========================================================================
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute("""
+        CREATE INDEX idx_issuer_name_trgm ON issuer USING GIN ((
+            COALESCE(issuer_name_1, '') || ' ' ||
+            COALESCE(issuer_name_2, '') || ' ' ||
+            COALESCE(issuer_name_3, '')
+        ) gin_trgm_ops)
+    """)
+
+    op.execute("""
+        CREATE INDEX idx_issue_desc_trgm ON issue USING GIN ((
+            COALESCE(issue_desc_1, '') || ' ' ||
+            COALESCE(issue_desc_2, '')
+        ) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_issue_desc_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_issuer_name_trgm")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
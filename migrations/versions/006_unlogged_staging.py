@@ -0,0 +1,33 @@
+"""Make staging tables UNLOGGED to skip WAL on bulk COPY.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Staging rows are truncated and reloaded on every run, so losing them
+    # on crash recovery is harmless
+    op.execute("ALTER TABLE stg_issuer SET UNLOGGED")
+    op.execute("ALTER TABLE stg_issue SET UNLOGGED")
+    op.execute("ALTER TABLE stg_issue_attribute SET UNLOGGED")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE stg_issue_attribute SET LOGGED")
+    op.execute("ALTER TABLE stg_issue SET LOGGED")
+    op.execute("ALTER TABLE stg_issuer SET LOGGED")
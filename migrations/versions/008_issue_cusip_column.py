@@ -0,0 +1,232 @@
+"""Store the CUSIP as a generated column on issue and select it directly in views.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Views that project the CUSIP, in drop order
+VIEWS = ["v_security_summary", "v_security", "v_issue"]
+
+
+def _create_views(use_cusip_column: bool) -> None:
+    if use_cusip_column:
+        issue_cusip = "i.cusip"
+        iss_cusip = "iss.cusip"
+    else:
+        issue_cusip = "CONCAT(i.issuer_num, i.issue_num, i.issue_check)"
+        iss_cusip = "CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check)"
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_issue AS
+        SELECT
+            i.issuer_num,
+            i.issue_num,
+            {issue_cusip} AS cusip,
+            i.issue_check,
+            TRIM(CONCAT(i.issue_desc_1, i.issue_desc_2)) AS issue_description,
+            TRIM(CONCAT(i.issue_adl_1, i.issue_adl_2, i.issue_adl_3, i.issue_adl_4))
+                AS issue_additional_info,
+            i.issue_status,
+            rs.description AS issue_status_desc,
+            i.dated_date,
+            i.maturity_date,
+            i.partial_maturity,
+            i.rate,
+            i.govt_stimulus_program,
+            rg.description AS govt_stimulus_program_desc,
+            i.issue_transaction,
+            rx.description AS issue_transaction_desc,
+            i.issue_update_date
+        FROM issue i
+        LEFT JOIN ref_issue_status rs ON i.issue_status = rs.code
+        LEFT JOIN ref_issue_transaction rx ON i.issue_transaction = rx.code
+        LEFT JOIN ref_govt_stimulus_program rg ON i.govt_stimulus_program = rg.code
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_security AS
+        SELECT
+            {iss_cusip} AS cusip,
+            iss.issuer_num,
+            iss.issue_num,
+            iss.issue_check,
+            TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3))
+                AS issuer_name,
+            isr.issuer_type,
+            rit.description AS issuer_type_desc,
+            isr.issuer_status,
+            ris.description AS issuer_status_desc,
+            isr.issuer_state_code,
+            TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)) AS issue_description,
+            TRIM(CONCAT(iss.issue_adl_1, iss.issue_adl_2, iss.issue_adl_3, iss.issue_adl_4))
+                AS issue_additional_info,
+            iss.issue_status,
+            rss.description AS issue_status_desc,
+            iss.dated_date,
+            iss.maturity_date,
+            iss.rate,
+            iss.govt_stimulus_program,
+            rgs.description AS govt_stimulus_program_desc,
+            ia.ticker_symbol,
+            ia.currency_code,
+            ia.domicile_code,
+            ia.us_cfi_code,
+            ia.iso_cfi,
+            ia.payment_frequency,
+            rpf.description AS payment_frequency_desc,
+            ia.callable,
+            ia.putable,
+            ia.sinking_fund,
+            ia.taxable,
+            ia.alternative_min_tax,
+            ia.bank_q,
+            ia.depos_eligible,
+            ia.form,
+            ia.guarantee,
+            ia.rate_type,
+            ia.redemption,
+            ia.where_traded,
+            ia.underwriter,
+            ia.offering_amount,
+            ia.offering_amount_code,
+            CASE ia.offering_amount_code
+                WHEN 'K' THEN ia.offering_amount * 1000
+                WHEN 'M' THEN ia.offering_amount * 1000000
+                WHEN 'B' THEN ia.offering_amount * 1000000000
+                ELSE ia.offering_amount
+            END AS offering_amount_full,
+            ia.activity_date,
+            ia.first_coupon_date,
+            ia.closing_date,
+            ia.municipal_sale_date,
+            iss.issue_update_date
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issuer_status ris ON isr.issuer_status = ris.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+        LEFT JOIN ref_govt_stimulus_program rgs ON iss.govt_stimulus_program = rgs.code
+        LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_security_summary AS
+        SELECT
+            {iss_cusip} AS cusip,
+            TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3))
+                AS issuer_name,
+            TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)) AS issue_description,
+            ia.ticker_symbol,
+            rit.description AS issuer_type,
+            rss.description AS issue_status,
+            iss.rate,
+            iss.dated_date,
+            iss.maturity_date,
+            ia.currency_code,
+            ia.where_traded
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+    """)
+
+    for view in VIEWS:
+        op.execute(f"GRANT SELECT ON {view} TO web_anon")
+
+
+def _create_search_function(cusip: str) -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                {cusip},
+                TRIM(CONCAT(isr.issuer_name_1, isr.issuer_name_2, isr.issuer_name_3)),
+                TRIM(CONCAT(iss.issue_desc_1, iss.issue_desc_2)),
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ q.tq THEN 'issuer'
+                    WHEN iss.search_vector @@ q.tq THEN 'issue'
+                    ELSE 'attribute'
+                END,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+               OR iss.search_vector @@ q.tq
+               OR ia.search_vector @@ q.tq
+            ORDER BY search_rank DESC
+        $$ LANGUAGE sql STABLE PARALLEL SAFE
+    """)
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    # issuer_num and issue_num are NOT NULL; a missing check digit leaves an
+    # 8-character CUSIP, matching the CONCAT() the views used before
+    op.execute("""
+        ALTER TABLE issue ADD COLUMN cusip VARCHAR(9)
+            GENERATED ALWAYS AS (
+                issuer_num || issue_num || COALESCE(issue_check, '')
+            ) STORED
+    """)
+    op.execute("CREATE UNIQUE INDEX idx_issue_cusip ON issue(cusip)")
+
+    _create_views(use_cusip_column=True)
+    _create_search_function("iss.cusip")
+
+
+def downgrade() -> None:
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    _create_search_function(
+        "CONCAT(iss.issuer_num, iss.issue_num, iss.issue_check)::varchar(9)"
+    )
+
+    # Dropping the column also drops idx_issue_cusip
+    op.execute("ALTER TABLE issue DROP COLUMN cusip")
+
+    _create_views(use_cusip_column=False)
@@ -0,0 +1,301 @@
+"""Store full issuer names and issue descriptions as generated columns.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Views that project the full name or description, in drop order
+VIEWS = ["v_security_summary", "v_security", "v_issue", "v_issuer"]
+
+ISSUER_NAME_EXPR = (
+    "TRIM(CONCAT({a}.issuer_name_1, {a}.issuer_name_2, {a}.issuer_name_3))"
+)
+ISSUE_DESC_EXPR = "TRIM(CONCAT({a}.issue_desc_1, {a}.issue_desc_2))"
+
+
+def _create_views(use_full_columns: bool) -> None:
+    if use_full_columns:
+        i_name, isr_name = "i.issuer_name_full", "isr.issuer_name_full"
+        i_desc, iss_desc = "i.issue_description_full", "iss.issue_description_full"
+    else:
+        i_name = ISSUER_NAME_EXPR.format(a="i")
+        isr_name = ISSUER_NAME_EXPR.format(a="isr")
+        i_desc = ISSUE_DESC_EXPR.format(a="i")
+        iss_desc = ISSUE_DESC_EXPR.format(a="iss")
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_issuer AS
+        SELECT
+            i.issuer_num,
+            i.issuer_check,
+            {i_name} AS issuer_name,
+            TRIM(CONCAT(i.issuer_adl_1, i.issuer_adl_2, i.issuer_adl_3, i.issuer_adl_4))
+                AS issuer_additional_info,
+            i.issuer_sort_key,
+            i.issuer_type,
+            rt.description AS issuer_type_desc,
+            i.issuer_status,
+            rs.description AS issuer_status_desc,
+            i.issuer_del_date,
+            i.issuer_transaction,
+            rx.description AS issuer_transaction_desc,
+            i.issuer_state_code,
+            i.issuer_update_date
+        FROM issuer i
+        LEFT JOIN ref_issuer_type rt ON i.issuer_type = rt.code
+        LEFT JOIN ref_issuer_status rs ON i.issuer_status = rs.code
+        LEFT JOIN ref_issuer_transaction rx ON i.issuer_transaction = rx.code
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_issue AS
+        SELECT
+            i.issuer_num,
+            i.issue_num,
+            i.cusip AS cusip,
+            i.issue_check,
+            {i_desc} AS issue_description,
+            TRIM(CONCAT(i.issue_adl_1, i.issue_adl_2, i.issue_adl_3, i.issue_adl_4))
+                AS issue_additional_info,
+            i.issue_status,
+            rs.description AS issue_status_desc,
+            i.dated_date,
+            i.maturity_date,
+            i.partial_maturity,
+            i.rate,
+            i.govt_stimulus_program,
+            rg.description AS govt_stimulus_program_desc,
+            i.issue_transaction,
+            rx.description AS issue_transaction_desc,
+            i.issue_update_date
+        FROM issue i
+        LEFT JOIN ref_issue_status rs ON i.issue_status = rs.code
+        LEFT JOIN ref_issue_transaction rx ON i.issue_transaction = rx.code
+        LEFT JOIN ref_govt_stimulus_program rg ON i.govt_stimulus_program = rg.code
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_security AS
+        SELECT
+            iss.cusip AS cusip,
+            iss.issuer_num,
+            iss.issue_num,
+            iss.issue_check,
+            {isr_name} AS issuer_name,
+            isr.issuer_type,
+            rit.description AS issuer_type_desc,
+            isr.issuer_status,
+            ris.description AS issuer_status_desc,
+            isr.issuer_state_code,
+            {iss_desc} AS issue_description,
+            TRIM(CONCAT(iss.issue_adl_1, iss.issue_adl_2, iss.issue_adl_3, iss.issue_adl_4))
+                AS issue_additional_info,
+            iss.issue_status,
+            rss.description AS issue_status_desc,
+            iss.dated_date,
+            iss.maturity_date,
+            iss.rate,
+            iss.govt_stimulus_program,
+            rgs.description AS govt_stimulus_program_desc,
+            ia.ticker_symbol,
+            ia.currency_code,
+            ia.domicile_code,
+            ia.us_cfi_code,
+            ia.iso_cfi,
+            ia.payment_frequency,
+            rpf.description AS payment_frequency_desc,
+            ia.callable,
+            ia.putable,
+            ia.sinking_fund,
+            ia.taxable,
+            ia.alternative_min_tax,
+            ia.bank_q,
+            ia.depos_eligible,
+            ia.form,
+            ia.guarantee,
+            ia.rate_type,
+            ia.redemption,
+            ia.where_traded,
+            ia.underwriter,
+            ia.offering_amount,
+            ia.offering_amount_code,
+            CASE ia.offering_amount_code
+                WHEN 'K' THEN ia.offering_amount * 1000
+                WHEN 'M' THEN ia.offering_amount * 1000000
+                WHEN 'B' THEN ia.offering_amount * 1000000000
+                ELSE ia.offering_amount
+            END AS offering_amount_full,
+            ia.activity_date,
+            ia.first_coupon_date,
+            ia.closing_date,
+            ia.municipal_sale_date,
+            iss.issue_update_date
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issuer_status ris ON isr.issuer_status = ris.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+        LEFT JOIN ref_govt_stimulus_program rgs ON iss.govt_stimulus_program = rgs.code
+        LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_security_summary AS
+        SELECT
+            iss.cusip AS cusip,
+            {isr_name} AS issuer_name,
+            {iss_desc} AS issue_description,
+            ia.ticker_symbol,
+            rit.description AS issuer_type,
+            rss.description AS issue_status,
+            iss.rate,
+            iss.dated_date,
+            iss.maturity_date,
+            ia.currency_code,
+            ia.where_traded
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+    """)
+
+    for view in VIEWS:
+        op.execute(f"GRANT SELECT ON {view} TO web_anon")
+
+
+def _create_search_function(issuer_name: str, issue_description: str) -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                iss.cusip,
+                {issuer_name},
+                {issue_description},
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ q.tq THEN 'issuer'
+                    WHEN iss.search_vector @@ q.tq THEN 'issue'
+                    ELSE 'attribute'
+                END,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+               OR iss.search_vector @@ q.tq
+               OR ia.search_vector @@ q.tq
+            ORDER BY search_rank DESC
+        $$ LANGUAGE sql STABLE PARALLEL SAFE
+    """)
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    # Same value TRIM(CONCAT(...)) produced, but immutable so it can be stored
+    op.execute("""
+        ALTER TABLE issuer ADD COLUMN issuer_name_full VARCHAR(90)
+            GENERATED ALWAYS AS (
+                TRIM(
+                    COALESCE(issuer_name_1, '') ||
+                    COALESCE(issuer_name_2, '') ||
+                    COALESCE(issuer_name_3, '')
+                )
+            ) STORED
+    """)
+    op.execute("""
+        ALTER TABLE issue ADD COLUMN issue_description_full VARCHAR(60)
+            GENERATED ALWAYS AS (
+                TRIM(COALESCE(issue_desc_1, '') || COALESCE(issue_desc_2, ''))
+            ) STORED
+    """)
+
+    # Move the trigram indexes onto the columns the views expose, so ILIKE on
+    # v_issuer.issuer_name or v_issue.issue_description can use them
+    op.execute("DROP INDEX IF EXISTS idx_issuer_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_issue_desc_trgm")
+    op.execute(
+        "CREATE INDEX idx_issuer_name_trgm ON issuer "
+        "USING GIN (issuer_name_full gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_issue_desc_trgm ON issue "
+        "USING GIN (issue_description_full gin_trgm_ops)"
+    )
+
+    _create_views(use_full_columns=True)
+    _create_search_function("isr.issuer_name_full", "iss.issue_description_full")
+
+
+def downgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    _create_search_function(
+        ISSUER_NAME_EXPR.format(a="isr"), ISSUE_DESC_EXPR.format(a="iss")
+    )
+
+    # Dropping the columns also drops their trigram indexes
+    op.execute("ALTER TABLE issue DROP COLUMN issue_description_full")
+    op.execute("ALTER TABLE issuer DROP COLUMN issuer_name_full")
+
+    op.execute("""
+        CREATE INDEX idx_issuer_name_trgm ON issuer USING GIN ((
+            COALESCE(issuer_name_1, '') || ' ' ||
+            COALESCE(issuer_name_2, '') || ' ' ||
+            COALESCE(issuer_name_3, '')
+        ) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX idx_issue_desc_trgm ON issue USING GIN ((
+            COALESCE(issue_desc_1, '') || ' ' ||
+            COALESCE(issue_desc_2, '')
+        ) gin_trgm_ops)
+    """)
+
+    _create_views(use_full_columns=False)
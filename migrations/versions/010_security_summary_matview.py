@@ -0,0 +1,67 @@
+"""Materialize the security summary for read-heavy consumers.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # ==========================================================================
+    # MATERIALIZED SECURITY SUMMARY
+    # ==========================================================================
+    # Same rows as v_security_summary; refreshed by the loader after each load
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_security_summary AS
+        SELECT
+            iss.cusip,
+            isr.issuer_name_full AS issuer_name,
+            iss.issue_description_full AS issue_description,
+            ia.ticker_symbol,
+            rit.description AS issuer_type,
+            rss.description AS issue_status,
+            iss.rate,
+            iss.dated_date,
+            iss.maturity_date,
+            ia.currency_code,
+            ia.where_traded
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+    """)
+
+    # REFRESH ... CONCURRENTLY requires a unique index
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_security_summary_cusip "
+        "ON mv_security_summary(cusip)"
+    )
+    op.execute("""
+        CREATE INDEX idx_mv_security_summary_search ON mv_security_summary
+            USING GIN (to_tsvector('english', issuer_name || ' ' || issue_description))
+    """)
+
+    op.execute("GRANT SELECT ON mv_security_summary TO web_anon")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_security_summary")
@@ -0,0 +1,205 @@
+"""Store the scaled offering amount as a generated column on issue_attribute.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Views that project offering_amount_full, in drop order
+VIEWS = ["v_security", "v_issue_attribute"]
+
+OFFERING_AMOUNT_FULL_CASE = """CASE ia.offering_amount_code
+                WHEN 'K' THEN ia.offering_amount * 1000
+                WHEN 'M' THEN ia.offering_amount * 1000000
+                WHEN 'B' THEN ia.offering_amount * 1000000000
+                ELSE ia.offering_amount
+            END"""
+
+
+def _create_views(use_stored_column: bool) -> None:
+    offering_amount_full = (
+        "ia.offering_amount_full" if use_stored_column else OFFERING_AMOUNT_FULL_CASE
+    )
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_issue_attribute AS
+        SELECT
+            ia.issuer_num,
+            ia.issue_num,
+            CONCAT(ia.issuer_num, ia.issue_num) AS cusip_base,
+            ia.alternative_min_tax,
+            ia.bank_q,
+            ia.callable,
+            ia.activity_date,
+            ia.first_coupon_date,
+            ia.init_pub_off,
+            ia.payment_frequency,
+            rpf.description AS payment_frequency_desc,
+            ia.currency_code,
+            ia.domicile_code,
+            ia.underwriter,
+            ia.us_cfi_code,
+            ia.closing_date,
+            ia.ticker_symbol,
+            ia.iso_cfi,
+            ia.depos_eligible,
+            ia.pre_refund,
+            ia.refundable,
+            ia.remarketed,
+            ia.sinking_fund,
+            ia.taxable,
+            ia.form,
+            ia.enhancements,
+            ia.fund_distrb_policy,
+            ia.fund_inv_policy,
+            ia.fund_type,
+            ia.guarantee,
+            ia.income_type,
+            ia.insured_by,
+            ia.ownership_restr,
+            ia.payment_status,
+            ia.preferred_type,
+            ia.putable,
+            ia.rate_type,
+            ia.redemption,
+            ia.source_doc,
+            ia.sponsoring,
+            ia.voting_rights,
+            ia.warrant_assets,
+            ia.warrant_status,
+            ia.warrant_type,
+            ia.where_traded,
+            ia.auditor,
+            ia.paying_agent,
+            ia.tender_agent,
+            ia.xfer_agent,
+            ia.bond_counsel,
+            ia.financial_advisor,
+            ia.municipal_sale_date,
+            ia.sale_type,
+            rst.description AS sale_type_desc,
+            ia.offering_amount,
+            ia.offering_amount_code,
+            roa.description AS offering_amount_code_desc,
+            {offering_amount_full} AS offering_amount_full
+        FROM issue_attribute ia
+        LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
+        LEFT JOIN ref_sale_type rst ON ia.sale_type = rst.code
+        LEFT JOIN ref_offering_amount_code roa ON ia.offering_amount_code = roa.code
+    """)
+
+    op.execute(f"""
+        CREATE OR REPLACE VIEW v_security AS
+        SELECT
+            iss.cusip AS cusip,
+            iss.issuer_num,
+            iss.issue_num,
+            iss.issue_check,
+            isr.issuer_name_full AS issuer_name,
+            isr.issuer_type,
+            rit.description AS issuer_type_desc,
+            isr.issuer_status,
+            ris.description AS issuer_status_desc,
+            isr.issuer_state_code,
+            iss.issue_description_full AS issue_description,
+            TRIM(CONCAT(iss.issue_adl_1, iss.issue_adl_2, iss.issue_adl_3, iss.issue_adl_4))
+                AS issue_additional_info,
+            iss.issue_status,
+            rss.description AS issue_status_desc,
+            iss.dated_date,
+            iss.maturity_date,
+            iss.rate,
+            iss.govt_stimulus_program,
+            rgs.description AS govt_stimulus_program_desc,
+            ia.ticker_symbol,
+            ia.currency_code,
+            ia.domicile_code,
+            ia.us_cfi_code,
+            ia.iso_cfi,
+            ia.payment_frequency,
+            rpf.description AS payment_frequency_desc,
+            ia.callable,
+            ia.putable,
+            ia.sinking_fund,
+            ia.taxable,
+            ia.alternative_min_tax,
+            ia.bank_q,
+            ia.depos_eligible,
+            ia.form,
+            ia.guarantee,
+            ia.rate_type,
+            ia.redemption,
+            ia.where_traded,
+            ia.underwriter,
+            ia.offering_amount,
+            ia.offering_amount_code,
+            {offering_amount_full} AS offering_amount_full,
+            ia.activity_date,
+            ia.first_coupon_date,
+            ia.closing_date,
+            ia.municipal_sale_date,
+            iss.issue_update_date
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issuer_status ris ON isr.issuer_status = ris.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+        LEFT JOIN ref_govt_stimulus_program rgs ON iss.govt_stimulus_program = rgs.code
+        LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
+    """)
+
+    for view in VIEWS:
+        op.execute(f"GRANT SELECT ON {view} TO web_anon")
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    # DECIMAL(5,1) scaled by at most 10^9 fits in DECIMAL(18,1)
+    op.execute("""
+        ALTER TABLE issue_attribute ADD COLUMN offering_amount_full DECIMAL(18,1)
+            GENERATED ALWAYS AS (
+                offering_amount * CASE offering_amount_code
+                    WHEN 'K' THEN 1000
+                    WHEN 'M' THEN 1000000
+                    WHEN 'B' THEN 1000000000
+                    ELSE 1
+                END
+            ) STORED
+    """)
+    op.execute(
+        "CREATE INDEX idx_issue_attr_offering_amount "
+        "ON issue_attribute(offering_amount_full)"
+    )
+
+    _create_views(use_stored_column=True)
+
+
+def downgrade() -> None:
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    # Dropping the column also drops idx_issue_attr_offering_amount
+    op.execute("ALTER TABLE issue_attribute DROP COLUMN offering_amount_full")
+
+    _create_views(use_stored_column=False)
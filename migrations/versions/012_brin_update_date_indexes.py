@@ -0,0 +1,46 @@
+"""Add BRIN indexes on the load-ordered update/activity date columns.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # Each daily upsert appends new row versions, so these dates track physical
+    # row order closely enough for block-range min/max summaries to prune well
+    op.execute("""
+        CREATE INDEX idx_issuer_update_brin ON issuer
+            USING BRIN (issuer_update_date) WITH (pages_per_range = 32)
+    """)
+    op.execute("""
+        CREATE INDEX idx_issue_update_brin ON issue
+            USING BRIN (issue_update_date) WITH (pages_per_range = 32)
+    """)
+    op.execute("""
+        CREATE INDEX idx_issue_attr_activity_brin ON issue_attribute
+            USING BRIN (activity_date) WITH (pages_per_range = 32)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_issue_attr_activity_brin")
+    op.execute("DROP INDEX IF EXISTS idx_issue_update_brin")
+    op.execute("DROP INDEX IF EXISTS idx_issuer_update_brin")
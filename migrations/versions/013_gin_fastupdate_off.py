@@ -0,0 +1,42 @@
+"""Disable the GIN pending list on search indexes.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+GIN_INDEXES = [
+    "idx_issuer_search",
+    "idx_issue_search",
+    "idx_issue_attr_search",
+    "idx_issuer_name_trgm",
+    "idx_issue_desc_trgm",
+    "idx_mv_security_summary_search",
+]
+
+
+def upgrade() -> None:
+    # Writes only happen in the daily load, so merge entries into the index
+    # immediately rather than making every search scan a pending list
+    for index in GIN_INDEXES:
+        op.execute(f"ALTER INDEX {index} SET (fastupdate = off)")
+        # Turning fastupdate off does not flush entries already pending
+        op.execute(f"SELECT gin_clean_pending_list('{index}'::regclass)")
+
+
+def downgrade() -> None:
+    for index in GIN_INDEXES:
+        op.execute(f"ALTER INDEX {index} RESET (fastupdate)")
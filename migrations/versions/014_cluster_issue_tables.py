@@ -0,0 +1,46 @@
+"""Cluster issue and issue_attribute on their primary keys.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: str | None = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the CLUSTER below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # Leave free space on each page so upserted row versions can stay near
+    # their neighbours, then order both heaps by the (issuer_num, issue_num)
+    # join key. A later plain "CLUSTER issue" reuses the recorded index.
+    op.execute("""
+        ALTER TABLE issue SET (fillfactor = 90);
+        ALTER TABLE issue_attribute SET (fillfactor = 90);
+
+        CLUSTER issue USING pk_issue;
+        CLUSTER issue_attribute USING pk_issue_attribute;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE issue_attribute SET WITHOUT CLUSTER;
+        ALTER TABLE issue SET WITHOUT CLUSTER;
+
+        ALTER TABLE issue_attribute RESET (fillfactor);
+        ALTER TABLE issue RESET (fillfactor);
+    """)
@@ -0,0 +1,404 @@
+"""Rebuild issue_attribute with its columns ordered to minimise alignment padding.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: str | None = "014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Views reading issue_attribute, in drop order
+VIEWS = ["v_security_summary", "v_security", "v_issue_attribute"]
+
+# Every non-generated column, in the new heap order: 4-byte aligned DATEs
+# straight after the key, then numeric, the 1-byte "char" flags and codes,
+# short codes, and the long descriptive text last.
+COLUMNS = [
+    "issuer_num",
+    "issue_num",
+    "activity_date",
+    "first_coupon_date",
+    "closing_date",
+    "municipal_sale_date",
+    "offering_amount",
+    "alternative_min_tax",
+    "bank_q",
+    "callable",
+    "init_pub_off",
+    "depos_eligible",
+    "pre_refund",
+    "refundable",
+    "remarketed",
+    "sinking_fund",
+    "taxable",
+    "payment_frequency",
+    "sale_type",
+    "offering_amount_code",
+    "domicile_code",
+    "currency_code",
+    "us_cfi_code",
+    "iso_cfi",
+    "ticker_symbol",
+    "form",
+    "enhancements",
+    "fund_distrb_policy",
+    "fund_inv_policy",
+    "fund_type",
+    "guarantee",
+    "income_type",
+    "insured_by",
+    "ownership_restr",
+    "payment_status",
+    "preferred_type",
+    "putable",
+    "rate_type",
+    "redemption",
+    "source_doc",
+    "sponsoring",
+    "voting_rights",
+    "warrant_assets",
+    "warrant_status",
+    "warrant_type",
+    "where_traded",
+    "underwriter",
+    "auditor",
+    "paying_agent",
+    "tender_agent",
+    "xfer_agent",
+    "bond_counsel",
+    "financial_advisor",
+]
+
+
+def _create_views() -> None:
+    op.execute("""
+        CREATE OR REPLACE VIEW v_issue_attribute AS
+        SELECT
+            ia.issuer_num,
+            ia.issue_num,
+            CONCAT(ia.issuer_num, ia.issue_num) AS cusip_base,
+            ia.alternative_min_tax,
+            ia.bank_q,
+            ia.callable,
+            ia.activity_date,
+            ia.first_coupon_date,
+            ia.init_pub_off,
+            ia.payment_frequency,
+            rpf.description AS payment_frequency_desc,
+            ia.currency_code,
+            ia.domicile_code,
+            ia.underwriter,
+            ia.us_cfi_code,
+            ia.closing_date,
+            ia.ticker_symbol,
+            ia.iso_cfi,
+            ia.depos_eligible,
+            ia.pre_refund,
+            ia.refundable,
+            ia.remarketed,
+            ia.sinking_fund,
+            ia.taxable,
+            ia.form,
+            ia.enhancements,
+            ia.fund_distrb_policy,
+            ia.fund_inv_policy,
+            ia.fund_type,
+            ia.guarantee,
+            ia.income_type,
+            ia.insured_by,
+            ia.ownership_restr,
+            ia.payment_status,
+            ia.preferred_type,
+            ia.putable,
+            ia.rate_type,
+            ia.redemption,
+            ia.source_doc,
+            ia.sponsoring,
+            ia.voting_rights,
+            ia.warrant_assets,
+            ia.warrant_status,
+            ia.warrant_type,
+            ia.where_traded,
+            ia.auditor,
+            ia.paying_agent,
+            ia.tender_agent,
+            ia.xfer_agent,
+            ia.bond_counsel,
+            ia.financial_advisor,
+            ia.municipal_sale_date,
+            ia.sale_type,
+            rst.description AS sale_type_desc,
+            ia.offering_amount,
+            ia.offering_amount_code,
+            roa.description AS offering_amount_code_desc,
+            ia.offering_amount_full
+        FROM issue_attribute ia
+        LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
+        LEFT JOIN ref_sale_type rst ON ia.sale_type = rst.code
+        LEFT JOIN ref_offering_amount_code roa ON ia.offering_amount_code = roa.code
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE VIEW v_security AS
+        SELECT
+            iss.cusip,
+            iss.issuer_num,
+            iss.issue_num,
+            iss.issue_check,
+            isr.issuer_name_full AS issuer_name,
+            isr.issuer_type,
+            rit.description AS issuer_type_desc,
+            isr.issuer_status,
+            ris.description AS issuer_status_desc,
+            isr.issuer_state_code,
+            iss.issue_description_full AS issue_description,
+            TRIM(CONCAT(iss.issue_adl_1, iss.issue_adl_2, iss.issue_adl_3, iss.issue_adl_4)) AS issue_additional_info,
+            iss.issue_status,
+            rss.description AS issue_status_desc,
+            iss.dated_date,
+            iss.maturity_date,
+            iss.rate,
+            iss.govt_stimulus_program,
+            rgs.description AS govt_stimulus_program_desc,
+            ia.ticker_symbol,
+            ia.currency_code,
+            ia.domicile_code,
+            ia.us_cfi_code,
+            ia.iso_cfi,
+            ia.payment_frequency,
+            rpf.description AS payment_frequency_desc,
+            ia.callable,
+            ia.putable,
+            ia.sinking_fund,
+            ia.taxable,
+            ia.alternative_min_tax,
+            ia.bank_q,
+            ia.depos_eligible,
+            ia.form,
+            ia.guarantee,
+            ia.rate_type,
+            ia.redemption,
+            ia.where_traded,
+            ia.underwriter,
+            ia.offering_amount,
+            ia.offering_amount_code,
+            ia.offering_amount_full,
+            ia.activity_date,
+            ia.first_coupon_date,
+            ia.closing_date,
+            ia.municipal_sale_date,
+            iss.issue_update_date
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issuer_status ris ON isr.issuer_status = ris.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+        LEFT JOIN ref_govt_stimulus_program rgs ON iss.govt_stimulus_program = rgs.code
+        LEFT JOIN ref_payment_frequency rpf ON ia.payment_frequency = rpf.code
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE VIEW v_security_summary AS
+        SELECT
+            iss.cusip,
+            isr.issuer_name_full AS issuer_name,
+            iss.issue_description_full AS issue_description,
+            ia.ticker_symbol,
+            rit.description AS issuer_type,
+            rss.description AS issue_status,
+            iss.rate,
+            iss.dated_date,
+            iss.maturity_date,
+            ia.currency_code,
+            ia.where_traded
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+    """)
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_security_summary AS
+        SELECT
+            iss.cusip,
+            isr.issuer_name_full AS issuer_name,
+            iss.issue_description_full AS issue_description,
+            ia.ticker_symbol,
+            rit.description AS issuer_type,
+            rss.description AS issue_status,
+            iss.rate,
+            iss.dated_date,
+            iss.maturity_date,
+            ia.currency_code,
+            ia.where_traded
+        FROM issue iss
+        INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+        LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                     AND iss.issue_num = ia.issue_num
+        LEFT JOIN ref_issuer_type rit ON isr.issuer_type = rit.code
+        LEFT JOIN ref_issue_status rss ON iss.issue_status = rss.code
+    """)
+
+    op.execute("""
+        CREATE UNIQUE INDEX idx_mv_security_summary_cusip
+            ON mv_security_summary(cusip)
+    """)
+
+    op.execute("""
+        CREATE INDEX idx_mv_security_summary_search ON mv_security_summary
+            USING GIN (to_tsvector('english', issuer_name || ' ' || issue_description))
+            WITH (fastupdate = off)
+    """)
+
+    for view in VIEWS:
+        op.execute(f"GRANT SELECT ON {view} TO web_anon")
+    op.execute("GRANT SELECT ON mv_security_summary TO web_anon")
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_security_summary")
+    for view in VIEWS:
+        op.execute(f"DROP VIEW IF EXISTS {view}")
+
+    # ==========================================================================
+    # REBUILD ISSUE_ATTRIBUTE
+    # ==========================================================================
+    # Postgres stores columns in declaration order, so the only way to reorder
+    # them is to copy the rows into a new heap. Rows go in primary-key order,
+    # which leaves the table clustered as revision 014 set it up.
+    op.execute("""
+        CREATE TABLE issue_attribute_new (
+            issuer_num              VARCHAR(6) NOT NULL,
+            issue_num               VARCHAR(2) NOT NULL,
+            activity_date           DATE,
+            first_coupon_date       DATE,
+            closing_date            DATE,
+            municipal_sale_date     DATE,
+            offering_amount         DECIMAL(5,1),
+            offering_amount_full    DECIMAL(18,1) GENERATED ALWAYS AS (
+                offering_amount * CASE offering_amount_code
+                    WHEN 'K' THEN 1000
+                    WHEN 'M' THEN 1000000
+                    WHEN 'B' THEN 1000000000
+                    ELSE 1
+                END
+            ) STORED,
+            alternative_min_tax     "char",
+            bank_q                  "char",
+            callable                "char",
+            init_pub_off            "char",
+            depos_eligible          "char",
+            pre_refund              "char",
+            refundable              "char",
+            remarketed              "char",
+            sinking_fund            "char",
+            taxable                 "char",
+            payment_frequency       "char",
+            sale_type               "char",
+            offering_amount_code    "char",
+            domicile_code           VARCHAR(2),
+            currency_code           VARCHAR(3),
+            us_cfi_code             VARCHAR(6),
+            iso_cfi                 VARCHAR(6),
+            ticker_symbol           VARCHAR(10),
+            form                    VARCHAR(50),
+            enhancements            VARCHAR(50),
+            fund_distrb_policy      VARCHAR(50),
+            fund_inv_policy         VARCHAR(50),
+            fund_type               VARCHAR(50),
+            guarantee               VARCHAR(50),
+            income_type             VARCHAR(50),
+            insured_by              VARCHAR(50),
+            ownership_restr         VARCHAR(50),
+            payment_status          VARCHAR(50),
+            preferred_type          VARCHAR(50),
+            putable                 VARCHAR(50),
+            rate_type               VARCHAR(50),
+            redemption              VARCHAR(50),
+            source_doc              VARCHAR(50),
+            sponsoring              VARCHAR(50),
+            voting_rights           VARCHAR(50),
+            warrant_assets          VARCHAR(50),
+            warrant_status          VARCHAR(50),
+            warrant_type            VARCHAR(50),
+            where_traded            VARCHAR(50),
+            underwriter             VARCHAR(60),
+            auditor                 VARCHAR(60),
+            paying_agent            VARCHAR(60),
+            tender_agent            VARCHAR(60),
+            xfer_agent              VARCHAR(60),
+            bond_counsel            VARCHAR(60),
+            financial_advisor       VARCHAR(60),
+            search_vector           tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english',
+                    COALESCE(ticker_symbol, '') || ' ' ||
+                    COALESCE(underwriter, '')
+                ), 'C')
+            ) STORED
+        ) WITH (fillfactor = 90)
+    """)
+
+    columns = ", ".join(COLUMNS)
+    op.execute(f"""
+        INSERT INTO issue_attribute_new ({columns})
+        SELECT {columns} FROM issue_attribute
+        ORDER BY issuer_num, issue_num
+    """)
+
+    # Dropping the old table drops its constraints and indexes, freeing the names
+    op.execute("DROP TABLE issue_attribute")
+    op.execute("ALTER TABLE issue_attribute_new RENAME TO issue_attribute")
+
+    op.execute("""
+        ALTER TABLE issue_attribute
+            ADD CONSTRAINT pk_issue_attribute PRIMARY KEY (issuer_num, issue_num),
+            ADD CONSTRAINT fk_issue_attr_issue FOREIGN KEY (issuer_num, issue_num)
+                REFERENCES issue(issuer_num, issue_num),
+            ADD CONSTRAINT fk_issue_attr_payment_freq FOREIGN KEY (payment_frequency)
+                REFERENCES ref_payment_frequency(code),
+            ADD CONSTRAINT fk_issue_attr_sale_type FOREIGN KEY (sale_type)
+                REFERENCES ref_sale_type(code),
+            ADD CONSTRAINT fk_issue_attr_offering_code FOREIGN KEY (offering_amount_code)
+                REFERENCES ref_offering_amount_code(code);
+
+        ALTER TABLE issue_attribute CLUSTER ON pk_issue_attribute;
+
+        CREATE INDEX idx_issue_attr_currency ON issue_attribute(currency_code);
+        CREATE INDEX idx_issue_attr_domicile ON issue_attribute(domicile_code);
+        CREATE INDEX idx_issue_attr_ticker ON issue_attribute(ticker_symbol);
+        CREATE INDEX idx_issue_attr_offering_amount
+            ON issue_attribute(offering_amount_full);
+        CREATE INDEX idx_issue_attr_activity_brin ON issue_attribute
+            USING BRIN(activity_date) WITH (pages_per_range = 32);
+        CREATE INDEX idx_issue_attr_search ON issue_attribute
+            USING GIN(search_vector) WITH (fastupdate = off);
+
+        ANALYZE issue_attribute;
+    """)
+
+    _create_views()
+
+
+def downgrade() -> None:
+    # Column order is physical only: the loader, views and search function all
+    # address issue_attribute columns by name, so there is nothing to undo.
+    pass
@@ -0,0 +1,146 @@
+"""Split search_securities into one UNION ALL branch per matched entity.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: str | None = "015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # One branch per entity, each driven by its own GIN index. Later branches
+    # skip rows an earlier branch already returned, so match_type is a
+    # constant instead of a CASE re-testing every vector per row.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                iss.cusip,
+                isr.issuer_name_full,
+                iss.issue_description_full,
+                ia.ticker_symbol,
+                ia.underwriter,
+                'issuer'::text,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issuer isr
+            INNER JOIN issue iss ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+
+            UNION ALL
+
+            SELECT
+                iss.cusip,
+                isr.issuer_name_full,
+                iss.issue_description_full,
+                ia.ticker_symbol,
+                ia.underwriter,
+                'issue'::text,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                )
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE iss.search_vector @@ q.tq
+              AND NOT isr.search_vector @@ q.tq
+
+            UNION ALL
+
+            SELECT
+                iss.cusip,
+                isr.issuer_name_full,
+                iss.issue_description_full,
+                ia.ticker_symbol,
+                ia.underwriter,
+                'attribute'::text,
+                ts_rank(isr.search_vector || iss.search_vector || ia.search_vector, q.tq)
+            FROM q
+            CROSS JOIN issue_attribute ia
+            INNER JOIN issue iss ON iss.issuer_num = ia.issuer_num
+                                AND iss.issue_num = ia.issue_num
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            WHERE ia.search_vector @@ q.tq
+              AND NOT iss.search_vector @@ q.tq
+              AND NOT isr.search_vector @@ q.tq
+
+            ORDER BY search_rank DESC
+        $$ LANGUAGE sql STABLE PARALLEL SAFE
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_securities(search_query text)
+        RETURNS TABLE (
+            cusip varchar(9),
+            issuer_name text,
+            issue_description text,
+            ticker_symbol varchar(10),
+            underwriter varchar(60),
+            match_type text,
+            rank real
+        ) AS $$
+            WITH q AS (
+                SELECT plainto_tsquery('english', search_query) AS tq
+            )
+            SELECT
+                iss.cusip,
+                isr.issuer_name_full,
+                iss.issue_description_full,
+                ia.ticker_symbol,
+                ia.underwriter,
+                CASE
+                    WHEN isr.search_vector @@ q.tq THEN 'issuer'
+                    WHEN iss.search_vector @@ q.tq THEN 'issue'
+                    ELSE 'attribute'
+                END,
+                ts_rank(
+                    isr.search_vector || iss.search_vector
+                        || COALESCE(ia.search_vector, ''::tsvector),
+                    q.tq
+                ) AS search_rank
+            FROM q
+            CROSS JOIN issue iss
+            INNER JOIN issuer isr ON iss.issuer_num = isr.issuer_num
+            LEFT JOIN issue_attribute ia ON iss.issuer_num = ia.issuer_num
+                                         AND iss.issue_num = ia.issue_num
+            WHERE isr.search_vector @@ q.tq
+               OR iss.search_vector @@ q.tq
+               OR ia.search_vector @@ q.tq
+            ORDER BY search_rank DESC
+        $$ LANGUAGE sql STABLE PARALLEL SAFE
+    """)
@@ -0,0 +1,37 @@
+"""Cover the security summary's issue_attribute columns on the join key.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: str | None = "016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Opt-in maintenance settings for the index builds below (see env.py)
+    for statement in op.get_context().config.attributes["maintenance_session"]:
+        op.execute(statement)
+
+    # v_security_summary (and the mv_security_summary refresh) read only these
+    # three attribute columns, so the join can be served by an index-only scan.
+    # The ref_* lookups already hit their code primary keys.
+    op.execute("""
+        CREATE INDEX idx_issue_attr_summary ON issue_attribute(issuer_num, issue_num)
+            INCLUDE (ticker_symbol, currency_code, where_traded)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_issue_attr_summary")
@@ -0,0 +1,38 @@
+"""Disable autovacuum on the staging tables.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: str | None = "017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Staging tables are truncated before every COPY and read once by the
+    # upsert, so there are never dead tuples worth vacuuming or stats worth
+    # keeping between loads
+    op.execute("""
+        ALTER TABLE stg_issuer SET (autovacuum_enabled = false);
+        ALTER TABLE stg_issue SET (autovacuum_enabled = false);
+        ALTER TABLE stg_issue_attribute SET (autovacuum_enabled = false);
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE stg_issue_attribute RESET (autovacuum_enabled);
+        ALTER TABLE stg_issue RESET (autovacuum_enabled);
+        ALTER TABLE stg_issuer RESET (autovacuum_enabled);
+    """)
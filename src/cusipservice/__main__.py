@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 from datetime import date
 from pathlib import Path
@@ -14,9 +15,11 @@ from cusipservice.file_source import (
 from cusipservice.loader import (
     DbConfig,
     LoadResult,
+    LoadSource,
     detect_file_type,
-    load_file,
+    load_files,
     load_from_source,
+    refresh_security_summary,
 )
 
 
@@ -43,12 +46,14 @@ Examples:
 
     # File source options (mutually exclusive groups)
     source_group = parser.add_argument_group("file source")
-    source_group.add_argument(
+    location = source_group.add_mutually_exclusive_group(required=True)
+    location.add_argument(
         "files",
         nargs="*",
+        default=[],
         help="Path(s) to local PIP file(s)",
     )
-    source_group.add_argument(
+    location.add_argument(
         "--s3-bucket",
         help="S3 bucket name for PIP files",
     )
@@ -58,14 +63,20 @@ Examples:
         help="S3 prefix/path for PIP files (default: pip/)",
     )
     source_group.add_argument(
-        "--s3-key",
-        help="Specific S3 key to load (use with --s3-bucket)",
+        "--s3-year-prefix",
+        action="store_true",
+        help="Files are stored under <s3-prefix>YYYY/ directories (with --date)",
     )
     source_group.add_argument(
         "--s3-region",
         help="AWS region for S3 bucket (optional, uses default if not set)",
     )
-    source_group.add_argument(
+    s3_target = source_group.add_mutually_exclusive_group()
+    s3_target.add_argument(
+        "--s3-key",
+        help="Specific S3 key to load (use with --s3-bucket)",
+    )
+    s3_target.add_argument(
         "--date",
         help="Date to load files for (YYYY-MM-DD format, used with --s3-bucket)",
     )
@@ -77,6 +88,15 @@ Examples:
         help="File type (auto-detected from suffix if not specified)",
     )
 
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help=(
+            "Full reload: drop the master tables' secondary indexes (search "
+            "included) before loading and rebuild them concurrently afterwards"
+        ),
+    )
+
     # Database options
     db_group = parser.add_argument_group("database")
     db_group.add_argument("--host", default="localhost", help="Database host")
@@ -86,21 +106,14 @@ Examples:
     db_group.add_argument("--password", default="", help="Database password")
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
-    # Validate arguments
-    if args.s3_bucket and args.files:
-        parser.error("Cannot specify both local files and --s3-bucket")
-
-    if not args.s3_bucket and not args.files:
-        parser.error("Must specify either local files or --s3-bucket")
-
-    if args.s3_key and not args.s3_bucket:
-        parser.error("--s3-key requires --s3-bucket")
+    # argparse enforces files vs --s3-bucket and --s3-key vs --date
+    has_s3_target = args.s3_key is not None or args.date is not None
+    if has_s3_target and not args.s3_bucket:
+        parser.error("--s3-key and --date require --s3-bucket")
 
-    if args.date and not args.s3_bucket:
-        parser.error("--date requires --s3-bucket")
-
-    if args.s3_bucket and not args.s3_key and not args.date:
+    if args.s3_bucket and not has_s3_target:
         parser.error("--s3-bucket requires either --s3-key or --date")
 
     db_config: DbConfig = {
@@ -116,7 +129,9 @@ Examples:
 
     if args.files:
         # Load from local files
-        results, has_error = _load_local_files(args.files, args.type, db_config)
+        results, has_error = _load_local_files(
+            args.files, args.type, db_config, args.bulk
+        )
     elif args.s3_key:
         # Load specific S3 file
         results, has_error = _load_s3_file(
@@ -125,6 +140,7 @@ Examples:
             file_type=args.type,
             region=args.s3_region,
             db_config=db_config,
+            bulk_mode=args.bulk,
         )
     else:
         # Load from S3 by date
@@ -133,9 +149,14 @@ Examples:
             prefix=args.s3_prefix,
             date_str=args.date,
             region=args.s3_region,
+            year_prefix=args.s3_year_prefix,
             db_config=db_config,
+            bulk_mode=args.bulk,
         )
 
+    if not has_error and any(r.get("status") == "success" for r in results):
+        has_error = not refresh_security_summary(db_config)
+
     _print_summary(results)
     sys.exit(1 if has_error else 0)
 
@@ -144,11 +165,15 @@ def _load_local_files(
     filepaths: list[str],
     file_type: str | None,
     db_config: DbConfig,
+    bulk_mode: bool = False,
 ) -> tuple[list[LoadResult], bool]:
     """Load files from local filesystem."""
     results: list[LoadResult] = []
     has_error = False
+    load_order = ["issuer", "issue", "issue_attr"]
 
+    # Validate every file before loading any of them
+    typed_paths: list[tuple[Path, str]] = []
     for filepath in filepaths:
         path = Path(filepath)
         if not path.exists():
@@ -160,11 +185,28 @@ def _load_local_files(
             print(f"ERROR: Cannot detect file type for {filepath}. Use --type.")
             sys.exit(1)
 
-        result = load_file(path, detected_type, db_config)
-        results.append(result)
+        typed_paths.append((path, detected_type))
 
-        if result.get("status") == "error":
+    # Load in foreign key order regardless of command-line order; files of
+    # the same type keep their relative order
+    typed_paths.sort(key=lambda item: load_order.index(item[1]))
+
+    # Group into rounds with at most one file per type; each round stages
+    # its files concurrently and commits them in FK order
+    rounds: list[list[tuple[str, LoadSource, str]]] = []
+    for path, detected_type in typed_paths:
+        if not rounds or any(ft == detected_type for ft, _, _ in rounds[-1]):
+            rounds.append([])
+        rounds[-1].append((detected_type, path, str(path)))
+
+    for sources in rounds:
+        round_results = load_files(sources, db_config, bulk_mode or None)
+        results.extend(round_results)
+
+        if any(r.get("status") == "error" for r in round_results):
             has_error = True
+            # Stop on error to prevent FK violations
+            break
 
     return results, has_error
 
@@ -175,6 +217,7 @@ def _load_s3_file(
     file_type: str | None,
     region: str | None,
     db_config: DbConfig,
+    bulk_mode: bool = False,
 ) -> tuple[list[LoadResult], bool]:
     """Load a specific file from S3."""
     filename = key.split("/")[-1]
@@ -191,7 +234,9 @@ def _load_s3_file(
         s3_key=key,
     )
 
-    result = load_from_source(file_info, detected_type, db_config, file_source)
+    result = load_from_source(
+        file_info, detected_type, db_config, file_source, bulk_mode or None
+    )
     has_error = result.get("status") == "error"
 
     return [result], has_error
@@ -203,6 +248,8 @@ def _load_s3_by_date(
     date_str: str,
     region: str | None,
     db_config: DbConfig,
+    year_prefix: bool = False,
+    bulk_mode: bool = False,
 ) -> tuple[list[LoadResult], bool]:
     """Load all files for a date from S3."""
     try:
@@ -211,7 +258,9 @@ def _load_s3_by_date(
         print(f"ERROR: Invalid date format: {date_str}. Expected YYYY-MM-DD")
         sys.exit(1)
 
-    file_source = S3FileSource(bucket=bucket, prefix=prefix, region=region)
+    file_source = S3FileSource(
+        bucket=bucket, prefix=prefix, region=region, year_prefix=year_prefix
+    )
     files = file_source.find_files_for_date(target_date)
 
     results: list[LoadResult] = []
@@ -224,6 +273,21 @@ def _load_s3_by_date(
         "issue_attr": files.issue_attr,
     }
 
+    # Fetch all of the day's files concurrently before loading in FK order
+    found = [(ft, fi) for ft, fi in file_map.items() if fi is not None]
+    print(f"  Reading {len(found)} file(s) from S3...")
+    contents = file_source.read_files([fi for _, fi in found])
+    prefetched = {ft: data for (ft, _), data in zip(found, contents, strict=True)}
+
+    loaded = {
+        result["type"]: result
+        for result in load_files(
+            [(ft, prefetched[ft], fi.display_path) for ft, fi in found],
+            db_config,
+            bulk_mode or None,
+        )
+    }
+
     for file_type in load_order:
         file_info = file_map.get(file_type)
         if file_info is None:
@@ -239,12 +303,15 @@ def _load_s3_by_date(
             )
             continue
 
-        result = load_from_source(file_info, file_type, db_config, file_source)
+        if file_type not in loaded:
+            # Rolled back after an earlier failure
+            break
+
+        result = loaded[file_type]
         results.append(result)
 
         if result.get("status") == "error":
             has_error = True
-            # Stop on error to prevent FK violations
             break
 
     return results, has_error
@@ -252,9 +319,7 @@ def _load_s3_by_date(
 
 def _print_summary(results: list[LoadResult]) -> None:
     """Print load results summary."""
-    print(f"\n{'=' * 60}")
-    print("SUMMARY")
-    print(f"{'=' * 60}")
+    lines = ["", "=" * 60, "SUMMARY", "=" * 60]
     for r in results:
         status = r.get("status", "unknown")
         if status == "success":
@@ -266,11 +331,14 @@ def _print_summary(results: list[LoadResult]) -> None:
         file_type = r.get("type", "unknown")
         rows_read = r.get("rows_read", 0)
         rows_upserted = r.get("rows_upserted", 0)
-        print(
+        lines.append(
             f"  {status_icon} {file_type:12} | {rows_read:>8} read "
             f"| {rows_upserted:>8} upserted | {status}"
         )
 
+    # One write for the whole report instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 if __name__ == "__main__":
     main()
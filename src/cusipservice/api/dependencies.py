@@ -1,29 +1,201 @@
-"""FastAPI dependencies for authentication and configuration."""
+"""FastAPI dependencies for authentication, configuration and file discovery."""
 
 from __future__ import annotations
 
+import hmac
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
 from typing import Annotated
 
+import psycopg2
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from psycopg2.extensions import connection
+from psycopg2.pool import ThreadedConnectionPool
 
+from cusipservice.api.models import LoadRequest
 from cusipservice.config import Settings, get_settings
+from cusipservice.file_source import (
+    FileSet,
+    LocalFileSource,
+    S3FileSource,
+    create_file_source,
+)
 from cusipservice.loader import DbConfig
 
 security = HTTPBearer()
 
+# File source and the files it found for the requested date
+FilesForDate = tuple[LocalFileSource | S3FileSource, FileSet]
+
+# Small shared pool for the API's own short queries (health probes); bulk
+# loads open their own connection for the length of the transaction.
+DB_POOL_MAX_CONNECTIONS = 4
+
+_db_pool: ThreadedConnectionPool | None = None
+_db_pool_config: DbConfig | None = None
+_db_pool_lock = threading.Lock()
+# Connections checked out per pool, so a replaced pool is closed only once
+# its last borrower has returned
+_db_pool_borrowers: dict[ThreadedConnectionPool, int] = {}
+# ThreadedConnectionPool raises PoolError when exhausted; callers queue here
+# instead so a burst of probes waits rather than reporting the DB as down
+_db_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX_CONNECTIONS)
+
 
 def get_db_config(
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> DbConfig:
     """Get database configuration as typed dict."""
-    return {
-        "host": settings.db_host,
-        "port": settings.db_port,
-        "dbname": settings.db_name,
-        "user": settings.db_user,
-        "password": settings.db_password,
-    }
+    return settings.db_config
+
+
+def get_db_pool() -> ThreadedConnectionPool:
+    """Get the shared connection pool, connecting on first use.
+
+    The pool is replaced when the database config changes, e.g. after
+    get_settings() picks up rotated credentials. Connections still checked
+    out from the old pool are closed as they are returned. Raises
+    psycopg2.Error if the database is unreachable; the next call tries again.
+    """
+    db_config = get_db_config(get_settings())
+    with _db_pool_lock:
+        return _current_pool(db_config)
+
+
+def _current_pool(db_config: DbConfig) -> ThreadedConnectionPool:
+    """Return the pool for db_config, replacing a stale one. Hold the lock."""
+    global _db_pool, _db_pool_config
+    if _db_pool is not None and db_config != _db_pool_config:
+        _retire_pool()
+    if _db_pool is None:
+        _db_pool = ThreadedConnectionPool(
+            1,
+            DB_POOL_MAX_CONNECTIONS,
+            application_name="cusip-api",
+            **db_config,
+        )
+        _db_pool_config = db_config
+    return _db_pool
+
+
+def _retire_pool() -> None:
+    """Stop handing out the current pool. Hold the lock.
+
+    The pool is closed now if nothing is checked out, otherwise by the last
+    db_connection() caller to return a connection to it.
+    """
+    global _db_pool, _db_pool_config
+    if _db_pool is not None and not _db_pool_borrowers.get(_db_pool):
+        _db_pool_borrowers.pop(_db_pool, None)
+        _db_pool.closeall()
+    _db_pool = None
+    _db_pool_config = None
+
+
+@contextmanager
+def db_connection() -> Iterator[connection]:
+    """Borrow a connection from the shared pool.
+
+    At most DB_POOL_MAX_CONNECTIONS callers hold a connection at once; the
+    rest wait for a free slot. The connection is closed rather than returned
+    if the caller raised psycopg2.Error or the pool was replaced meanwhile.
+    """
+    db_config = get_db_config(get_settings())
+    with _db_pool_slots:
+        with _db_pool_lock:
+            pool = _current_pool(db_config)
+            _db_pool_borrowers[pool] = _db_pool_borrowers.get(pool, 0) + 1
+        conn = None
+        broken = False
+        try:
+            conn = pool.getconn()
+            yield conn
+        except psycopg2.Error:
+            broken = True
+            raise
+        finally:
+            with _db_pool_lock:
+                retired = pool is not _db_pool
+                if conn is not None:
+                    pool.putconn(conn, close=broken or retired)
+                _db_pool_borrowers[pool] -= 1
+                if retired and not _db_pool_borrowers[pool]:
+                    del _db_pool_borrowers[pool]
+                    pool.closeall()
+
+
+def close_db_pool() -> None:
+    """Close the pool, or leave it to its borrowers to close if in use."""
+    with _db_pool_lock:
+        _retire_pool()
+
+
+@lru_cache(maxsize=8)
+def _cached_file_source(
+    source_type: str,
+    file_dir: Path,
+    s3_bucket: str,
+    s3_prefix: str,
+    s3_region: str | None,
+    s3_year_prefix: bool,
+) -> LocalFileSource | S3FileSource:
+    """Create a file source once per configuration.
+
+    Reusing the S3FileSource keeps its boto3 client, and with it the
+    credential lookup and HTTPS connection pool, for the life of the process.
+    """
+    return create_file_source(
+        source_type=source_type,
+        file_dir=file_dir,
+        s3_bucket=s3_bucket,
+        s3_prefix=s3_prefix,
+        s3_region=s3_region,
+        s3_year_prefix=s3_year_prefix,
+    )
+
+
+def _get_file_source(settings: Settings) -> LocalFileSource | S3FileSource:
+    """Get the file source for the current settings."""
+    return _cached_file_source(
+        settings.file_source,
+        settings.file_dir,
+        settings.s3_bucket,
+        settings.s3_prefix,
+        settings.s3_region if settings.s3_region else None,
+        settings.s3_year_prefix,
+    )
+
+
+def get_files_for_date(
+    request: LoadRequest,
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> FilesForDate:
+    """Discover the files for the requested date (default today).
+
+    Lookup errors become 404 (missing directory) or 400 (bad configuration).
+    Declared sync so FastAPI runs the directory or S3 listing in a thread.
+    """
+    target_date = request.date or date.today()
+    try:
+        file_source = _get_file_source(settings)
+        files = file_source.find_files_for_date(target_date)
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    return file_source, files
 
 
 def verify_token(
@@ -37,7 +209,10 @@ def verify_token(
             detail="API token not configured",
         )
 
-    if credentials.credentials != settings.api_token:
+    # Constant-time comparison so response timing does not leak the token
+    if not hmac.compare_digest(
+        credentials.credentials.encode(), settings.api_token.encode()
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token",
@@ -47,6 +47,13 @@ class LoadResponse(BaseModel):
     date: datetime.date
 
 
+class RefreshResponse(BaseModel):
+    """Response model for the security summary refresh endpoint."""
+
+    success: bool
+    message: str
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
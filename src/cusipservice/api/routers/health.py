@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from typing import Literal
 
-import psycopg2
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 
-from cusipservice.api.dependencies import get_db_config
+from cusipservice.api.dependencies import db_connection
 from cusipservice.api.models import HealthResponse
-from cusipservice.loader import DbConfig
 
 router = APIRouter(tags=["health"])
 
 
+def _ping_database() -> None:
+    """Run SELECT 1 on a pooled connection, discarding it if the query fails."""
+    with db_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT 1")
+
+
 @router.get("/health", response_model=HealthResponse)
-def health_check(
-    db_config: Annotated[DbConfig, Depends(get_db_config)],
-) -> HealthResponse:
+def health_check() -> HealthResponse:
     """
     Health check endpoint.
 
@@ -26,8 +28,7 @@ def health_check(
     """
     db_status: Literal["connected", "disconnected"]
     try:
-        conn = psycopg2.connect(**db_config)
-        conn.close()
+        _ping_database()
         db_status = "connected"
     except Exception:
         db_status = "disconnected"
@@ -40,17 +41,14 @@ def health_check(
 
 
 @router.get("/ready")
-def readiness_check(
-    db_config: Annotated[DbConfig, Depends(get_db_config)],
-) -> dict[str, str]:
+def readiness_check() -> dict[str, str]:
     """
     Kubernetes readiness probe.
 
     Returns 200 only if database is accessible.
     """
     try:
-        conn = psycopg2.connect(**db_config)
-        conn.close()
+        _ping_database()
         return {"status": "ready"}
     except Exception as e:
         return {"status": "not ready", "reason": str(e)}
@@ -2,27 +2,38 @@
 
 from __future__ import annotations
 
-from datetime import date
+from operator import attrgetter
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import anyio
+from fastapi import APIRouter, Depends
 
-from cusipservice.api.dependencies import get_db_config, verify_token
+from cusipservice.api.dependencies import (
+    FilesForDate,
+    get_db_config,
+    get_files_for_date,
+    verify_token,
+)
 from cusipservice.api.models import (
     FileLoadResult,
     JobStatus,
-    LoadRequest,
     LoadResponse,
+    RefreshResponse,
 )
-from cusipservice.config import Settings, get_settings
 from cusipservice.file_source import (
     FileInfo,
     FileSet,
     LocalFileSource,
     S3FileSource,
-    create_file_source,
 )
-from cusipservice.loader import DbConfig, load_from_source
+from cusipservice.loader import (
+    DbConfig,
+    LoadResult,
+    LoadSource,
+    load_files,
+    load_from_source,
+    refresh_security_summary,
+)
 
 router = APIRouter(
     prefix="/jobs",
@@ -30,15 +41,47 @@ router = APIRouter(
     dependencies=[Depends(verify_token)],
 )
 
+# Loads run in worker threads so the event loop stays free for probes. One
+# lock per file type keeps two requests from loading the same table at once.
+_load_locks: dict[str, anyio.Lock] = {
+    "issuer": anyio.Lock(),
+    "issue": anyio.Lock(),
+    "issue_attr": anyio.Lock(),
+}
+
+# FileSet attribute for each file type
+_FILE_GETTERS: dict[str, attrgetter[FileInfo | None]] = {
+    "issuer": attrgetter("issuer"),
+    "issue": attrgetter("issue"),
+    "issue_attr": attrgetter("issue_attr"),
+}
+
+
+def _missing_file_result(file_type: str, files: FileSet) -> FileLoadResult:
+    """Result for a file type with no file on the requested date."""
+    return FileLoadResult.model_construct(
+        file="",
+        type=file_type,
+        rows_read=0,
+        rows_upserted=0,
+        status=JobStatus.SKIPPED,
+        error=f"No {file_type} file found for date {files.target_date}",
+    )
+
 
-def _get_file_source(settings: Settings) -> LocalFileSource | S3FileSource:
-    """Create file source from settings."""
-    return create_file_source(
-        source_type=settings.file_source,
-        file_dir=settings.file_dir,
-        s3_bucket=settings.s3_bucket,
-        s3_prefix=settings.s3_prefix,
-        s3_region=settings.s3_region if settings.s3_region else None,
+def _to_file_load_result(result: LoadResult, file_type: str) -> FileLoadResult:
+    """Convert a loader LoadResult into the API model.
+
+    Built with model_construct: the values come from the loader's own
+    LoadResult and FastAPI validates the response model on the way out.
+    """
+    return FileLoadResult.model_construct(
+        file=result.get("file", ""),
+        type=result.get("type", file_type),
+        rows_read=result.get("rows_read", 0),
+        rows_upserted=result.get("rows_upserted", 0),
+        status=JobStatus(result.get("status", "error")),
+        error=result.get("error"),
     )
 
 
@@ -49,170 +92,169 @@ def _load_single_file(
     file_source: LocalFileSource | S3FileSource,
 ) -> FileLoadResult:
     """Load a single file type from the file set."""
-    file_map: dict[str, FileInfo | None] = {
-        "issuer": files.issuer,
-        "issue": files.issue,
-        "issue_attr": files.issue_attr,
-    }
-
-    file_info = file_map.get(file_type)
+    file_info = _FILE_GETTERS[file_type](files)
     if file_info is None:
-        return FileLoadResult(
-            file="",
-            type=file_type,  # type: ignore[arg-type]
-            rows_read=0,
-            rows_upserted=0,
-            status=JobStatus.SKIPPED,
-            error=f"No {file_type} file found for date {files.target_date}",
-        )
+        return _missing_file_result(file_type, files)
 
     result = load_from_source(file_info, file_type, db_config, file_source)
+    return _to_file_load_result(result, file_type)
 
-    return FileLoadResult(
-        file=result.get("file", ""),
-        type=result.get("type", file_type),  # type: ignore[arg-type]
-        rows_read=result.get("rows_read", 0),
-        rows_upserted=result.get("rows_upserted", 0),
-        status=JobStatus(result.get("status", "error")),
-        error=result.get("error"),
-    )
+
+async def _run_load(
+    file_type: str,
+    files: FileSet,
+    db_config: DbConfig,
+    file_source: LocalFileSource | S3FileSource,
+) -> FileLoadResult:
+    """Load one file type in a worker thread, one load per table at a time."""
+    async with _load_locks[file_type]:
+        return await anyio.to_thread.run_sync(
+            _load_single_file, file_type, files, db_config, file_source
+        )
 
 
 @router.post("/load-issuer", response_model=LoadResponse)
-def load_issuer(
-    request: LoadRequest,
-    settings: Annotated[Settings, Depends(get_settings)],
+async def load_issuer(
+    source: Annotated[FilesForDate, Depends(get_files_for_date)],
     db_config: Annotated[DbConfig, Depends(get_db_config)],
 ) -> LoadResponse:
     """Load issuer file (R.PIP) for the specified date."""
-    target_date = request.date or date.today()
-
-    try:
-        file_source = _get_file_source(settings)
-        files = file_source.find_files_for_date(target_date)
-    except FileNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-
-    result = _load_single_file("issuer", files, db_config, file_source)
+    file_source, files = source
+
+    result = await _run_load("issuer", files, db_config, file_source)
     success = result.status == JobStatus.SUCCESS
 
     return LoadResponse(
         success=success,
         message=f"Issuer load {'completed' if success else 'failed'}",
         results=[result],
-        date=target_date,
+        date=files.target_date,
     )
 
 
 @router.post("/load-issue", response_model=LoadResponse)
-def load_issue(
-    request: LoadRequest,
-    settings: Annotated[Settings, Depends(get_settings)],
+async def load_issue(
+    source: Annotated[FilesForDate, Depends(get_files_for_date)],
     db_config: Annotated[DbConfig, Depends(get_db_config)],
 ) -> LoadResponse:
     """Load issue file (E.PIP) for the specified date."""
-    target_date = request.date or date.today()
-
-    try:
-        file_source = _get_file_source(settings)
-        files = file_source.find_files_for_date(target_date)
-    except FileNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-
-    result = _load_single_file("issue", files, db_config, file_source)
+    file_source, files = source
+
+    result = await _run_load("issue", files, db_config, file_source)
     success = result.status == JobStatus.SUCCESS
 
     return LoadResponse(
         success=success,
         message=f"Issue load {'completed' if success else 'failed'}",
         results=[result],
-        date=target_date,
+        date=files.target_date,
     )
 
 
 @router.post("/load-issue-attr", response_model=LoadResponse)
-def load_issue_attr(
-    request: LoadRequest,
-    settings: Annotated[Settings, Depends(get_settings)],
+async def load_issue_attr(
+    source: Annotated[FilesForDate, Depends(get_files_for_date)],
     db_config: Annotated[DbConfig, Depends(get_db_config)],
 ) -> LoadResponse:
-    """Load issue attributes file (A.PIP) for the specified date."""
-    target_date = request.date or date.today()
-
-    try:
-        file_source = _get_file_source(settings)
-        files = file_source.find_files_for_date(target_date)
-    except FileNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-
-    result = _load_single_file("issue_attr", files, db_config, file_source)
+    """
+    Load issue attributes file (A.PIP) for the specified date.
+
+    After a successful load the materialized security summary is refreshed.
+    """
+    file_source, files = source
+
+    result = await _run_load("issue_attr", files, db_config, file_source)
     success = result.status == JobStatus.SUCCESS
 
+    # issue_attr is the last file in load order, so refresh the summary here
+    if success and not await anyio.to_thread.run_sync(
+        refresh_security_summary, db_config
+    ):
+        message = "Issue attributes loaded but security summary refresh failed"
+    else:
+        message = f"Issue attributes load {'completed' if success else 'failed'}"
+
     return LoadResponse(
         success=success,
-        message=f"Issue attributes load {'completed' if success else 'failed'}",
+        message=message,
         results=[result],
-        date=target_date,
+        date=files.target_date,
     )
 
 
 @router.post("/load-all", response_model=LoadResponse)
-def load_all(
-    request: LoadRequest,
-    settings: Annotated[Settings, Depends(get_settings)],
+async def load_all(
+    source: Annotated[FilesForDate, Depends(get_files_for_date)],
     db_config: Annotated[DbConfig, Depends(get_db_config)],
 ) -> LoadResponse:
     """
     Load all files in correct order: issuer -> issue -> issue_attr.
 
     Due to foreign key constraints, files must be loaded in this order.
-    If any load fails, subsequent loads are skipped.
+    If any load fails, subsequent loads are skipped. After a successful load
+    the materialized security summary is refreshed.
     """
-    target_date = request.date or date.today()
-
-    try:
-        file_source = _get_file_source(settings)
-        files = file_source.find_files_for_date(target_date)
-    except FileNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
+    file_source, files = source
 
     results: list[FileLoadResult] = []
     load_order = ["issuer", "issue", "issue_attr"]
 
+    # Hold every type's lock so no single-file load interleaves with ours
+    async with (
+        _load_locks["issuer"],
+        _load_locks["issue"],
+        _load_locks["issue_attr"],
+    ):
+        # Fetch every S3 object up front so the reads overlap; local files
+        # are streamed straight into COPY instead
+        prefetched: dict[str, bytes] = {}
+        if isinstance(file_source, S3FileSource):
+            found = [
+                (file_type, file_info)
+                for file_type in load_order
+                if (file_info := _FILE_GETTERS[file_type](files)) is not None
+            ]
+            contents = await anyio.to_thread.run_sync(
+                file_source.read_files, [file_info for _, file_info in found]
+            )
+            prefetched = {
+                file_type: content
+                for (file_type, _), content in zip(found, contents, strict=True)
+            }
+
+        sources: list[tuple[str, LoadSource, str]] = []
+        for file_type in load_order:
+            file_info = _FILE_GETTERS[file_type](files)
+            if file_info is None:
+                continue
+            load_source: LoadSource
+            if file_type in prefetched:
+                load_source = prefetched[file_type]
+            elif file_info.local_path is not None:
+                load_source = file_info.local_path
+            else:
+                # Neither prefetched nor local: read off the event loop
+                load_source = await anyio.to_thread.run_sync(
+                    file_source.read_bytes, file_info
+                )
+            sources.append((file_type, load_source, file_info.display_path))
+
+        # Staging runs concurrently; upserts commit in FK order
+        loaded = {
+            result["type"]: result
+            for result in await anyio.to_thread.run_sync(load_files, sources, db_config)
+        }
+
     for file_type in load_order:
-        result = _load_single_file(file_type, files, db_config, file_source)
+        if _FILE_GETTERS[file_type](files) is None:
+            results.append(_missing_file_result(file_type, files))
+            continue
+
+        if file_type not in loaded:
+            # Rolled back after an earlier failure
+            break
+
+        result = _to_file_load_result(loaded[file_type], file_type)
         results.append(result)
 
         # Stop if a load fails (not just skipped)
@@ -224,8 +266,16 @@ def load_all(
     )
     has_error = any(r.status == JobStatus.ERROR for r in results)
 
+    summary_refreshed = True
+    if not has_error and any(r.status == JobStatus.SUCCESS for r in results):
+        summary_refreshed = await anyio.to_thread.run_sync(
+            refresh_security_summary, db_config
+        )
+
     if has_error:
         message = "Load failed - check results for details"
+    elif not summary_refreshed:
+        message = "Files loaded but security summary refresh failed"
     elif all_success:
         message = "All files loaded successfully"
     else:
@@ -235,5 +285,23 @@ def load_all(
         success=all_success and not has_error,
         message=message,
         results=results,
-        date=target_date,
+        date=files.target_date,
+    )
+
+
+@router.post("/refresh-summary", response_model=RefreshResponse)
+async def refresh_summary(
+    db_config: Annotated[DbConfig, Depends(get_db_config)],
+) -> RefreshResponse:
+    """
+    Refresh the materialized security summary.
+
+    Use after loading issuer or issue files on their own; load-all and
+    load-issue-attr refresh it automatically.
+    """
+    success = await anyio.to_thread.run_sync(refresh_security_summary, db_config)
+
+    return RefreshResponse(
+        success=success,
+        message=f"Security summary refresh {'completed' if success else 'failed'}",
     )
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from functools import lru_cache
+import threading
+import time
+from functools import cached_property
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import Field, model_validator
+import orjson
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from cusipservice.loader import DbConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +38,58 @@ def _fetch_secret_from_aws(secret_arn: str, region: str | None = None) -> dict:
 
     client = boto3.client("secretsmanager", region_name=region or None)
     response = client.get_secret_value(SecretId=secret_arn)
-    return json.loads(response["SecretString"])
+    return orjson.loads(response["SecretString"])
+
+
+SECRETS_BATCH_SIZE = 20
+
+
+def _fetch_secrets_batch(
+    secret_ids: list[str], region: str | None = None
+) -> dict[str, dict[str, Any]]:
+    """Fetch several secrets from AWS Secrets Manager with BatchGetSecretValue.
+
+    Args:
+        secret_ids: ARNs or names of the secrets
+        region: AWS region (optional, uses default if not set)
+
+    Returns:
+        Parsed JSON secrets keyed by ARN, by name and by each requested ID
+    """
+    try:
+        import boto3
+    except ImportError as e:
+        raise ImportError(
+            "boto3 is required to fetch secrets from AWS Secrets Manager. "
+            "Install it with: uv add boto3"
+        ) from e
+
+    client = boto3.client("secretsmanager", region_name=region or None)
+    secrets: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(secret_ids), SECRETS_BATCH_SIZE):
+        response = client.batch_get_secret_value(
+            SecretIdList=secret_ids[start : start + SECRETS_BATCH_SIZE]
+        )
+        if response.get("Errors"):
+            failed = ", ".join(err["SecretId"] for err in response["Errors"])
+            raise RuntimeError(f"Failed to fetch secrets: {failed}")
+        for value in response["SecretValues"]:
+            parsed = orjson.loads(value["SecretString"])
+            secrets[value["ARN"]] = parsed
+            secrets[value["Name"]] = parsed
+
+    # A partial ARN omits the random suffix Secrets Manager appends to the
+    # full ARN ("-AbCdEf"), so it matches neither key above
+    for secret_id in secret_ids:
+        if secret_id in secrets:
+            continue
+        matches = [
+            parsed for arn, parsed in secrets.items() if arn.startswith(f"{secret_id}-")
+        ]
+        if not matches:
+            raise RuntimeError(f"Secrets Manager returned no value for {secret_id}")
+        secrets[secret_id] = matches[0]
+    return secrets
 
 
 class Settings(BaseSettings):
@@ -66,33 +121,10 @@ class Settings(BaseSettings):
         default="",
         description="AWS region for Secrets Manager (optional)",
     )
-
-    @model_validator(mode="after")
-    def _load_db_secret(self) -> "Settings":
-        """Load database credentials from Secrets Manager if ARN is provided."""
-        if not self.db_secret_arn:
-            return self
-
-        logger.info("Fetching database credentials from Secrets Manager")
-        secret = _fetch_secret_from_aws(
-            self.db_secret_arn,
-            self.db_secret_region or None,
-        )
-
-        # RDS secrets use these standard keys
-        if "host" in secret:
-            self.db_host = secret["host"]
-        if "port" in secret:
-            self.db_port = int(secret["port"])
-        if "dbname" in secret:
-            self.db_name = secret["dbname"]
-        if "username" in secret:
-            self.db_user = secret["username"]
-        if "password" in secret:
-            self.db_password = secret["password"]
-
-        logger.info(f"Loaded DB credentials for {self.db_user}@{self.db_host}")
-        return self
+    secret_arns: list[str] = Field(
+        default_factory=list,
+        description="Other secrets to fetch alongside the DB secret (JSON list)",
+    )
 
     # File source configuration
     file_source: Literal["local", "s3"] = Field(
@@ -119,16 +151,72 @@ class Settings(BaseSettings):
         default="",
         description="AWS region for S3 bucket (optional, uses default if not set)",
     )
+    s3_year_prefix: bool = Field(
+        default=False,
+        description="PIP files are stored under {s3_prefix}YYYY/ directories",
+    )
 
     # API
     api_token: str = Field(
         default="",
         description="Bearer token for job endpoint authentication",
     )
+    cors_origins: list[str] = Field(
+        default_factory=list,
+        description="Browser origins allowed by CORS (JSON list; empty disables CORS)",
+    )
+
+    @cached_property
+    def secrets(self) -> dict[str, dict[str, Any]]:
+        """Return db_secret_arn and secret_arns, fetched together on first use.
+
+        Values are parsed JSON keyed by each requested ID as well as by ARN
+        and name. Several secrets are retrieved with one BatchGetSecretValue
+        call (per 20) instead of a round trip each.
+        """
+        secret_ids = [
+            secret_id
+            for secret_id in dict.fromkeys([self.db_secret_arn, *self.secret_arns])
+            if secret_id
+        ]
+        if not secret_ids:
+            return {}
+
+        logger.info(f"Fetching {len(secret_ids)} secret(s) from Secrets Manager")
+        region = self.db_secret_region or None
+        if len(secret_ids) == 1:
+            return {secret_ids[0]: _fetch_secret_from_aws(secret_ids[0], region)}
+        return _fetch_secrets_batch(secret_ids, region)
+
+    def _apply_db_secret(self) -> None:
+        """Overlay database credentials from Secrets Manager onto db_* fields."""
+        secret = self.secrets[self.db_secret_arn]
+
+        # RDS secrets use these standard keys
+        if "host" in secret:
+            self.db_host = secret["host"]
+        if "port" in secret:
+            self.db_port = int(secret["port"])
+        if "dbname" in secret:
+            self.db_name = secret["dbname"]
+        if "username" in secret:
+            self.db_user = secret["username"]
+        if "password" in secret:
+            self.db_password = secret["password"]
+
+        logger.info(f"Loaded DB credentials for {self.db_user}@{self.db_host}")
+
+    @cached_property
+    def db_config(self) -> DbConfig:
+        """Return database config dict compatible with psycopg2.
+
+        Built once per instance; callers must treat it as read-only. When
+        db_secret_arn is set the secret is fetched here, on first use, so
+        settings that never touch the database skip the Secrets Manager call.
+        """
+        if self.db_secret_arn:
+            self._apply_db_secret()
 
-    @property
-    def db_config(self) -> dict[str, str | int]:
-        """Return database config dict compatible with psycopg2."""
         return {
             "host": self.db_host,
             "port": self.db_port,
@@ -139,7 +227,28 @@ class Settings(BaseSettings):
         }
 
 
-@lru_cache
+# Settings are rebuilt after this long so rotated secrets are picked up
+# without a restart
+SETTINGS_TTL_SECONDS = 900.0
+
+_settings: Settings | None = None
+_settings_loaded_at = 0.0
+_settings_lock = threading.Lock()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the cached settings instance, rebuilt every SETTINGS_TTL_SECONDS."""
+    global _settings, _settings_loaded_at
+    with _settings_lock:
+        now = time.monotonic()
+        if _settings is None or now - _settings_loaded_at >= SETTINGS_TTL_SECONDS:
+            _settings = Settings()
+            _settings_loaded_at = now
+        return _settings
+
+
+def invalidate_settings() -> None:
+    """Drop the cached settings so the next get_settings() rebuilds them."""
+    global _settings
+    with _settings_lock:
+        _settings = None
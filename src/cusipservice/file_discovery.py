@@ -7,7 +7,6 @@ and utility functions for date parsing.
 
 from __future__ import annotations
 
-import re
 from datetime import date
 from pathlib import Path
 from typing import NamedTuple
@@ -93,8 +92,9 @@ def parse_date_param(date_str: str | None) -> date:
     if date_str is None:
         return date.today()
 
-    # Validate format YYYY-MM-DD
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+    # fromisoformat also accepts basic (YYYYMMDD) and week dates on 3.11+,
+    # so pin the extended YYYY-MM-DD shape before handing it over
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
         raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD")
 
     return date.fromisoformat(date_str)
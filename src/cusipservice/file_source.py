@@ -8,13 +8,34 @@ the standard AWS_PROFILE environment variable.
 
 from __future__ import annotations
 
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
+    from mypy_boto3_s3.paginator import ListObjectsV2Paginator
+
+
+@lru_cache(maxsize=8)
+def _get_s3_client(region: str | None) -> S3Client:
+    """Create one S3 client per region and share it across file sources.
+
+    boto3 clients are thread-safe; sharing one keeps its credential
+    resolution and HTTPS connection pool across requests.
+    """
+    import boto3
+
+    if region:
+        return boto3.client("s3", region_name=region)
+    return boto3.client("s3")
 
 
 @dataclass
@@ -47,6 +68,38 @@ class FileSet:
     target_date: date
 
 
+# Recent find_files_for_date results: key -> (expires at, FileSet)
+FILESET_CACHE_MAX_ENTRIES = 32
+LOCAL_FILESET_TTL_SECONDS = 60.0
+S3_FILESET_TTL_SECONDS = 30.0
+
+_fileset_cache: dict[tuple[object, ...], tuple[float, FileSet]] = {}
+_fileset_cache_lock = threading.Lock()
+
+
+def _cached_fileset(
+    key: tuple[object, ...], ttl: float, find: Callable[[], FileSet]
+) -> FileSet:
+    """Return a cached FileSet for key, calling find() when missing or expired."""
+    now = time.monotonic()
+    with _fileset_cache_lock:
+        entry = _fileset_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    file_set = find()
+
+    with _fileset_cache_lock:
+        if len(_fileset_cache) >= FILESET_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (exp, _) in _fileset_cache.items() if exp <= now]:
+                del _fileset_cache[stale]
+        if len(_fileset_cache) >= FILESET_CACHE_MAX_ENTRIES:
+            # Still full of live entries: drop the oldest
+            del _fileset_cache[next(iter(_fileset_cache))]
+        _fileset_cache[key] = (now + ttl, file_set)
+    return file_set
+
+
 class FileSource(Protocol):
     """Protocol for file source implementations."""
 
@@ -54,10 +107,25 @@ class FileSource(Protocol):
         """Find CUSIP PIP files for a specific date."""
         ...
 
-    def read_file(self, file_info: FileInfo) -> list[str]:
-        """Read file contents as a list of lines."""
+    def read_file(self, file_info: FileInfo) -> Iterable[str]:
+        """Read file contents as lines (possibly lazily)."""
         ...
 
+    def read_bytes(self, file_info: FileInfo) -> bytes:
+        """Read the raw file contents."""
+        ...
+
+    def read_files(self, file_infos: list[FileInfo]) -> list[bytes]:
+        """Read the raw contents of several files, in the same order."""
+        ...
+
+
+def _iter_file_lines(path: Path) -> Iterator[str]:
+    """Yield lines (without line endings) from a text file, closing it at the end."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
 
 class LocalFileSource:
     """File source for local filesystem."""
@@ -66,33 +134,62 @@ class LocalFileSource:
         self.directory = directory
 
     def find_files_for_date(self, target_date: date | None = None) -> FileSet:
-        """Find CUSIP PIP files in local directory for a specific date."""
+        """Find CUSIP PIP files in local directory for a specific date.
+
+        Results are cached briefly, keyed on the directory's mtime so adding,
+        removing or renaming a file invalidates them.
+        """
         if target_date is None:
             target_date = date.today()
 
-        if not self.directory.exists():
-            raise FileNotFoundError(f"Directory not found: {self.directory}")
+        try:
+            mtime_ns = self.directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Directory not found: {self.directory}") from None
 
+        day = target_date
+        return _cached_fileset(
+            ("local", str(self.directory), mtime_ns, day),
+            LOCAL_FILESET_TTL_SECONDS,
+            lambda: self._scan_for_date(day),
+        )
+
+    def _scan_for_date(self, target_date: date) -> FileSet:
+        """Scan the directory for the files of one date."""
         date_pattern = target_date.strftime("%m-%d")
-        pattern = f"CED{date_pattern}*.PIP"
+        prefix = f"CED{date_pattern}"
 
         issuer_file: FileInfo | None = None
         issue_file: FileInfo | None = None
         issue_attr_file: FileInfo | None = None
 
-        for filepath in self.directory.glob(pattern):
-            name_upper = filepath.name.upper()
-            file_info = FileInfo(
-                name=filepath.name,
-                source="local",
-                local_path=filepath,
-            )
-            if name_upper.endswith("R.PIP"):
-                issuer_file = file_info
-            elif name_upper.endswith("E.PIP"):
-                issue_file = file_info
-            elif name_upper.endswith("A.PIP"):
-                issue_attr_file = file_info
+        # Single directory pass matching CED{mm-dd}*.PIP; only the matches
+        # become Path objects, and the scan stops once all three are found
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix) or not name.endswith(".PIP"):
+                    continue
+
+                # File type is the letter just before the extension
+                kind = name[-5:-4].upper()
+                if kind not in ("R", "E", "A"):
+                    continue
+
+                file_info = FileInfo(
+                    name=name,
+                    source="local",
+                    local_path=Path(entry.path),
+                )
+                if kind == "R":
+                    issuer_file = file_info
+                elif kind == "E":
+                    issue_file = file_info
+                else:
+                    issue_attr_file = file_info
+
+                if issuer_file and issue_file and issue_attr_file:
+                    break
 
         return FileSet(
             issuer=issuer_file,
@@ -101,13 +198,23 @@ class LocalFileSource:
             target_date=target_date,
         )
 
-    def read_file(self, file_info: FileInfo) -> list[str]:
-        """Read file contents from local filesystem."""
+    def read_file(self, file_info: FileInfo) -> Iterator[str]:
+        """Read file contents from local filesystem, one line at a time."""
         if file_info.local_path is None:
             raise ValueError(f"No local path for file: {file_info.name}")
 
-        with open(file_info.local_path, encoding="utf-8", errors="replace") as f:
-            return f.read().splitlines()
+        return _iter_file_lines(file_info.local_path)
+
+    def read_bytes(self, file_info: FileInfo) -> bytes:
+        """Read the raw file contents from local filesystem."""
+        if file_info.local_path is None:
+            raise ValueError(f"No local path for file: {file_info.name}")
+
+        return file_info.local_path.read_bytes()
+
+    def read_files(self, file_infos: list[FileInfo]) -> list[bytes]:
+        """Read several local files in order."""
+        return [self.read_bytes(file_info) for file_info in file_infos]
 
 
 class S3FileSource:
@@ -126,45 +233,71 @@ class S3FileSource:
         bucket: str,
         prefix: str = "pip/",
         region: str | None = None,
+        year_prefix: bool = False,
     ) -> None:
         self.bucket = bucket
         self.prefix = prefix.rstrip("/") + "/" if prefix else ""
         self.region = region
-        self._client: S3Client | None = None
+        # Files live under {prefix}YYYY/ rather than directly under prefix
+        self.year_prefix = year_prefix
+        self._paginator: ListObjectsV2Paginator | None = None
 
     @property
     def client(self) -> S3Client:
-        """Lazily create S3 client (respects AWS_PROFILE)."""
-        if self._client is None:
-            import boto3
+        """Get the shared S3 client for this region (respects AWS_PROFILE)."""
+        return _get_s3_client(self.region)
 
-            if self.region:
-                self._client = boto3.client("s3", region_name=self.region)
-            else:
-                self._client = boto3.client("s3")
-        return self._client
+    @property
+    def paginator(self) -> ListObjectsV2Paginator:
+        """Lazily create the list_objects_v2 paginator."""
+        if self._paginator is None:
+            self._paginator = self.client.get_paginator("list_objects_v2")
+        return self._paginator
 
     def find_files_for_date(self, target_date: date | None = None) -> FileSet:
-        """Find CUSIP PIP files in S3 bucket for a specific date."""
+        """Find CUSIP PIP files in S3 bucket for a specific date.
+
+        Results are cached for S3_FILESET_TTL_SECONDS, so a file uploaded
+        just after a lookup may take that long to be seen.
+        """
         if target_date is None:
             target_date = date.today()
 
+        day = target_date
+        return _cached_fileset(
+            ("s3", self.bucket, self.prefix, self.year_prefix, day),
+            S3_FILESET_TTL_SECONDS,
+            lambda: self._list_for_date(day),
+        )
+
+    def _list_for_date(self, target_date: date) -> FileSet:
+        """List the bucket for the files of one date."""
         date_pattern = target_date.strftime("%m-%d")
-        search_prefix = f"{self.prefix}CED{date_pattern}"
+        year_dir = f"{target_date.year}/" if self.year_prefix else ""
+        search_prefix = f"{self.prefix}{year_dir}CED{date_pattern}"
 
         issuer_file: FileInfo | None = None
         issue_file: FileInfo | None = None
         issue_attr_file: FileInfo | None = None
 
-        # List objects matching the date pattern
-        paginator = self.client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(Bucket=self.bucket, Prefix=search_prefix):
+        # A day has three files, so small pages are enough, and listing
+        # stops as soon as all three are found
+        pages = self.paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=search_prefix,
+            PaginationConfig={"PageSize": 10},
+        )
+        for page in pages:
             for obj in page.get("Contents", []):
                 key = obj["Key"]
-                name = key.split("/")[-1]  # Get filename from full key
-                name_upper = name.upper()
+                name = key.rpartition("/")[2]  # Get filename from full key
 
-                if not name_upper.endswith(".PIP"):
+                # Extension is matched case-insensitively; the file type is
+                # the letter just before it
+                if name[-4:].upper() != ".PIP":
+                    continue
+                kind = name[-5:-4].upper()
+                if kind not in ("R", "E", "A"):
                     continue
 
                 file_info = FileInfo(
@@ -174,13 +307,19 @@ class S3FileSource:
                     s3_key=key,
                 )
 
-                if name_upper.endswith("R.PIP"):
+                if kind == "R":
                     issuer_file = file_info
-                elif name_upper.endswith("E.PIP"):
+                elif kind == "E":
                     issue_file = file_info
-                elif name_upper.endswith("A.PIP"):
+                else:
                     issue_attr_file = file_info
 
+                if issuer_file and issue_file and issue_attr_file:
+                    break
+
+            if issuer_file and issue_file and issue_attr_file:
+                break
+
         return FileSet(
             issuer=issuer_file,
             issue=issue_file,
@@ -190,6 +329,11 @@ class S3FileSource:
 
     def read_file(self, file_info: FileInfo) -> list[str]:
         """Read file contents from S3."""
+        content = self.read_bytes(file_info).decode("utf-8", errors="replace")
+        return content.splitlines()
+
+    def read_bytes(self, file_info: FileInfo) -> bytes:
+        """Read the raw object contents from S3."""
         if file_info.s3_bucket is None or file_info.s3_key is None:
             raise ValueError(f"No S3 location for file: {file_info.name}")
 
@@ -197,8 +341,19 @@ class S3FileSource:
             Bucket=file_info.s3_bucket,
             Key=file_info.s3_key,
         )
-        content = response["Body"].read().decode("utf-8", errors="replace")
-        return content.splitlines()
+        return response["Body"].read()
+
+    def read_files(self, file_infos: list[FileInfo]) -> list[bytes]:
+        """Read several S3 objects concurrently, returning contents in order.
+
+        Each GetObject is a separate network round trip, so fetching a day's
+        files in parallel costs roughly one round trip instead of three.
+        """
+        if len(file_infos) <= 1:
+            return [self.read_bytes(file_info) for file_info in file_infos]
+
+        with ThreadPoolExecutor(max_workers=len(file_infos)) as executor:
+            return list(executor.map(self.read_bytes, file_infos))
 
 
 def create_file_source(
@@ -207,6 +362,7 @@ def create_file_source(
     s3_bucket: str | None = None,
     s3_prefix: str = "pip/",
     s3_region: str | None = None,
+    s3_year_prefix: bool = False,
 ) -> LocalFileSource | S3FileSource:
     """
     Factory function to create the appropriate file source.
@@ -217,6 +373,7 @@ def create_file_source(
         s3_bucket: S3 bucket name for S3 source
         s3_prefix: S3 prefix/path for S3 source
         s3_region: AWS region for S3 source (optional)
+        s3_year_prefix: S3 files are under {s3_prefix}YYYY/ directories
 
     Returns:
         Configured file source instance
@@ -235,6 +392,7 @@ def create_file_source(
             bucket=s3_bucket,
             prefix=s3_prefix,
             region=s3_region if s3_region else None,
+            year_prefix=s3_year_prefix,
         )
     else:
         raise ValueError(f"Unknown file source type: {source_type}")
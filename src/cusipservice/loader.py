@@ -12,16 +12,36 @@ Supports loading from:
 
 from __future__ import annotations
 
-from io import StringIO
+import logging
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO, RawIOBase, StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, TextIO, TypedDict
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    NamedTuple,
+    NotRequired,
+    TextIO,
+    TypedDict,
+)
 
 import psycopg2
+import psycopg2.errors
 from psycopg2 import sql
 
 if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
     from cusipservice.file_source import FileInfo, LocalFileSource, S3FileSource
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # TYPE DEFINITIONS
 # =============================================================================
@@ -34,6 +54,11 @@ class FileConfig(TypedDict):
     staging_table: str
     pk_columns: list[str]
     columns: list[str]
+    # Default for bulk mode (see _drop_indexes_for_bulk_load); full reloads
+    # only, the CLI's --bulk turns it on for every type
+    bulk_mode: NotRequired[bool]
+    # COPY straight into the master table while it has no rows
+    direct_copy_if_empty: NotRequired[bool]
 
 
 class DbConfig(TypedDict):
@@ -44,6 +69,7 @@ class DbConfig(TypedDict):
     dbname: str
     user: str
     password: str
+    sslmode: NotRequired[str]
 
 
 class LoadResult(TypedDict, total=False):
@@ -64,6 +90,7 @@ class LoadResult(TypedDict, total=False):
 FILE_CONFIG: dict[str, FileConfig] = {
     "issuer": {
         "table": "issuer",
+        "direct_copy_if_empty": True,
         "staging_table": "stg_issuer",
         "pk_columns": ["issuer_num"],
         "columns": [
@@ -87,6 +114,7 @@ FILE_CONFIG: dict[str, FileConfig] = {
     },
     "issue": {
         "table": "issue",
+        "direct_copy_if_empty": True,
         "staging_table": "stg_issue",
         "pk_columns": ["issuer_num", "issue_num"],
         "columns": [
@@ -111,6 +139,7 @@ FILE_CONFIG: dict[str, FileConfig] = {
     },
     "issue_attr": {
         "table": "issue_attribute",
+        "direct_copy_if_empty": True,
         "staging_table": "stg_issue_attribute",
         "pk_columns": ["issuer_num", "issue_num"],
         "columns": [
@@ -187,187 +216,676 @@ def clean_line(line: str) -> str:
     return line.rstrip("\n\r\x1a")
 
 
-def clean_lines(raw_lines: list[str]) -> list[str]:
+def iter_clean_lines(raw_lines: Iterable[str]) -> Iterator[str]:
     """
-    Clean a list of raw lines, removing empty lines and footer.
+    Lazily clean raw lines, skipping empty lines and the footer.
 
     Args:
-        raw_lines: List of raw lines (may include newlines, footers, etc.)
+        raw_lines: Raw lines (may include newlines, footers, etc.)
 
-    Returns:
-        List of cleaned data lines
+    Yields:
+        Cleaned data lines
     """
-    lines: list[str] = []
+    # clean_line and is_footer are inlined; this loop runs once per row
     for raw_line in raw_lines:
-        line = clean_line(raw_line)
+        line = raw_line.rstrip("\n\r\x1a")
         if not line:
             continue
-        if is_footer(line):
-            print(f"  Skipping footer: {line[:50]}...")
+        if line.startswith("999999"):
+            logger.info("  Skipping footer: %s...", line[:50])
             continue
-        lines.append(line)
-    return lines
+        yield line
+
+
+def clean_lines(raw_lines: Iterable[str]) -> list[str]:
+    """
+    Clean a list of raw lines, removing empty lines and footer.
+
+    Args:
+        raw_lines: List of raw lines (may include newlines, footers, etc.)
+
+    Returns:
+        List of cleaned data lines
+    """
+    return list(iter_clean_lines(raw_lines))
+
+
+def iter_clean_file(filepath: Path) -> Iterator[str]:
+    """Yield cleaned data lines from a local file, one line in memory at a time."""
+    with open(filepath, encoding="utf-8", errors="replace") as f:
+        yield from iter_clean_lines(f)
 
 
 def read_and_clean_file(filepath: Path) -> list[str]:
     """Read file from local filesystem, clean lines, and exclude footer row."""
-    with open(filepath, encoding="utf-8", errors="replace") as f:
-        raw_lines = f.read().splitlines()
-    return clean_lines(raw_lines)
+    return list(iter_clean_file(filepath))
 
 
-def lines_to_copy_buffer(lines: list[str]) -> StringIO:
+class CleanedFileReader(RawIOBase):
+    """
+    Read-only stream over a PIP file that yields cleaned COPY input.
+
+    Applies the same rules as clean_lines one chunk at a time, carrying any
+    partial trailing line over to the next read, so COPY memory stays at
+    roughly one chunk regardless of file size. Carriage returns and EOF
+    markers are removed wherever they appear, not only at line ends.
+    Non-ASCII chunks are round-tripped through UTF-8 with errors="replace"
+    so invalid bytes never reach the server. The number of data rows is
+    available as ``rows`` once the stream has been consumed.
+
+    Accepts a local path or raw file contents already in memory (e.g. an S3
+    object), so neither is decoded to str on the way to COPY.
+    """
+
+    def __init__(self, source: Path | bytes, chunk_size: int = 1 << 20) -> None:
+        super().__init__()
+        self._file: BinaryIO
+        # Local files are read once, front to back: ask the kernel for a
+        # wider readahead, and drop the pages from the cache when done
+        self._fadvise = isinstance(source, Path) and hasattr(os, "posix_fadvise")
+        if isinstance(source, Path):
+            self._file = open(source, "rb")  # noqa: SIM115 - closed in close()
+            if self._fadvise:
+                os.posix_fadvise(self._file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        else:
+            self._file = BytesIO(source)
+        self._chunk_size = chunk_size
+        self._residual = b""
+        # Cleaned bytes waiting to be read, and how far into them we are
+        self._pending = memoryview(b"")
+        self._pos = 0
+        self._eof = False
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: WriteableBuffer) -> int:
+        while self._pos >= len(self._pending) and not self._eof:
+            self._fill()
+        view = memoryview(b).cast("B")
+        n = min(len(view), len(self._pending) - self._pos)
+        view[:n] = self._pending[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        if self._fadvise and not self._file.closed:
+            os.posix_fadvise(self._file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        self._file.close()
+        super().close()
+
+    def _fill(self) -> None:
+        """Read the next chunk and queue its complete, cleaned lines.
+
+        Cleaning runs over the whole chunk with bytes methods; only a chunk
+        that contains the trailer record is split into lines.
+        """
+        chunk = self._file.read(self._chunk_size)
+        if chunk:
+            data = self._residual + chunk
+            cut = data.rfind(b"\n") + 1
+            self._residual = data[cut:]
+            data = data[:cut]
+        else:
+            data, self._residual = self._residual + b"\n", b""
+            self._eof = True
+
+        data = data.replace(b"\r", b"").replace(b"\x1a", b"")
+        while b"\n\n" in data:
+            data = data.replace(b"\n\n", b"\n")
+        if data.startswith(b"\n"):
+            data = data[1:]
+        if data.startswith(b"999999") or b"\n999999" in data:
+            data = self._drop_footer(data)
+        if not data.isascii():
+            data = data.decode("utf-8", errors="replace").encode("utf-8")
+
+        self._pending = memoryview(data)
+        self._pos = 0
+        self.rows += data.count(b"\n")
+
+    @staticmethod
+    def _drop_footer(data: bytes) -> bytes:
+        """Remove trailer lines from newline-terminated cleaned data."""
+        kept: list[bytes] = []
+        for line in data.split(b"\n")[:-1]:
+            if line.startswith(b"999999"):
+                logger.info(
+                    "  Skipping footer: %s...", line[:50].decode(errors="replace")
+                )
+            else:
+                kept.append(line)
+        kept.append(b"")
+        return b"\n".join(kept)
+
+
+def lines_to_copy_buffer(lines: Iterable[str]) -> StringIO:
     """Convert cleaned lines to a StringIO buffer for COPY."""
-    buffer = StringIO()
-    for line in lines:
-        buffer.write(line + "\n")
-    buffer.seek(0)
-    return buffer
+    lines = list(lines)
+    return StringIO("\n".join(lines) + "\n" if lines else "")
+
+
+def clean_lines_to_copy_buffer(raw_lines: Iterable[str]) -> tuple[StringIO, int]:
+    """Clean raw lines into a StringIO buffer for COPY, returning the row count."""
+    lines = clean_lines(raw_lines)
+    return lines_to_copy_buffer(lines), len(lines)
 
 
 # =============================================================================
 # DATABASE OPERATIONS
 # =============================================================================
 
+# Idle load connections kept for reuse, so repeated loads (scheduler retries,
+# API jobs) skip the connect, TLS and auth handshake. A load never waits for
+# one: a new connection is opened whenever none is idle. Connections idle for
+# longer than the limit are closed rather than risk a server-side timeout.
+LOAD_POOL_MAX_IDLE = 4
+LOAD_POOL_MAX_IDLE_SECONDS = 300.0
 
-def truncate_staging(cur: psycopg2.extensions.cursor, config: FileConfig) -> None:
-    """Truncate the staging table."""
-    cur.execute(
-        sql.SQL("TRUNCATE TABLE {}").format(sql.Identifier(config["staging_table"]))
-    )
+_idle_connections: list[tuple[psycopg2.extensions.connection, float]] = []
+_idle_config: DbConfig | None = None
+_idle_lock = threading.Lock()
 
 
-def copy_to_staging(
-    cur: psycopg2.extensions.cursor, config: FileConfig, buffer: TextIO
-) -> None:
-    """COPY data from buffer into staging table."""
-    columns = sql.SQL(", ").join(sql.Identifier(c) for c in config["columns"])
-    copy_sql = sql.SQL(
-        "COPY {} ({}) FROM STDIN WITH (FORMAT csv, DELIMITER '|', NULL '')"
-    ).format(sql.Identifier(config["staging_table"]), columns)
-    cur.copy_expert(copy_sql, buffer)
+def _connection_alive(conn: psycopg2.extensions.connection) -> bool:
+    """Round-trip a trivial query to catch idle connections the server dropped."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+    except psycopg2.Error:
+        return False
+    return True
 
 
-def upsert_to_master(cur: psycopg2.extensions.cursor, config: FileConfig) -> int:
-    """
-    Upsert from staging to master table using INSERT ... ON CONFLICT.
+def _acquire_connection(db_config: DbConfig) -> psycopg2.extensions.connection:
+    """Take a live idle load connection for db_config, or open a new one.
 
-    Returns number of rows affected.
+    conn.closed only notices a dead socket once libpq has tried to use it,
+    so a reused connection is pinged first rather than failing the load.
     """
+    global _idle_config
+    stale: list[psycopg2.extensions.connection] = []
+    while True:
+        conn = None
+        with _idle_lock:
+            if db_config != _idle_config:
+                # e.g. rotated credentials; connections for the old config go
+                stale = [c for c, _ in _idle_connections]
+                _idle_connections.clear()
+                _idle_config = db_config
+            cutoff = time.monotonic() - LOAD_POOL_MAX_IDLE_SECONDS
+            while _idle_connections:
+                candidate, released_at = _idle_connections.pop()
+                if released_at >= cutoff and not candidate.closed:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+        for old in stale:
+            old.close()
+        stale = []
+        if conn is None:
+            return psycopg2.connect(**db_config)
+        if _connection_alive(conn):
+            return conn
+        conn.close()
+
+
+def _release_connection(
+    conn: psycopg2.extensions.connection, db_config: DbConfig
+) -> None:
+    """Keep a finished load connection for reuse, or close it."""
+    reusable = (
+        not conn.closed
+        and conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    )
+    if reusable:
+        conn.autocommit = False
+        with _idle_lock:
+            if (
+                db_config == _idle_config
+                and len(_idle_connections) < LOAD_POOL_MAX_IDLE
+            ):
+                _idle_connections.append((conn, time.monotonic()))
+                return
+    conn.close()
+
+
+MERGE_MIN_SERVER_VERSION = 150000
+
+
+class LoadStatements(NamedTuple):
+    """SQL for loading one file type, composed once per process."""
+
+    truncate: sql.Composed
+    copy: sql.Composed
+    truncate_and_copy: sql.Composed
+    master_has_rows: sql.Composed
+    copy_direct: sql.Composed
+    merge: sql.Composed
+    insert_on_conflict: sql.Composed
+
+
+# Batch load that can simply be re-run, so trade commit durability for speed
+# and give the join room to stay in memory. Sent in the same simple-query
+# message as the upsert, or as the emptiness check on the direct COPY path,
+# so the settings cost no extra round trip.
+_LOAD_SESSION_SQL = sql.SQL(
+    "SET LOCAL synchronous_commit = off; SET LOCAL work_mem = '256MB'; "
+)
+
+
+_STATEMENTS: dict[str, LoadStatements] = {}
+
+
+def _build_statements(config: FileConfig) -> LoadStatements:
+    """Compose the truncate, COPY and upsert statements for a file config."""
     columns = config["columns"]
     pk_cols = config["pk_columns"]
     non_pk_cols = [c for c in columns if c not in pk_cols]
 
+    master = sql.Identifier(config["table"])
+    staging = sql.Identifier(config["staging_table"])
     col_list = sql.SQL(", ").join(sql.Identifier(c) for c in columns)
     pk_list = sql.SQL(", ").join(sql.Identifier(c) for c in pk_cols)
 
-    set_clause = sql.SQL(", ").join(
-        sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c))
-        for c in non_pk_cols
+    # ctid follows COPY order in the freshly truncated staging table
+    deduped = sql.SQL(
+        "SELECT DISTINCT ON ({pk}) {columns} FROM {staging} ORDER BY {pk}, ctid DESC"
+    ).format(staging=staging, columns=col_list, pk=pk_list)
+
+    merge = sql.SQL(
+        """
+        MERGE INTO {master} AS m
+        USING ({deduped}) AS s
+        ON {join}
+        WHEN MATCHED THEN UPDATE SET {set_clause}
+        WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({values})
+    """
+    ).format(
+        master=master,
+        deduped=deduped,
+        join=sql.SQL(" AND ").join(
+            sql.SQL("m.{0} = s.{0}").format(sql.Identifier(c)) for c in pk_cols
+        ),
+        set_clause=sql.SQL(", ").join(
+            sql.SQL("{0} = s.{0}").format(sql.Identifier(c)) for c in non_pk_cols
+        ),
+        columns=col_list,
+        values=sql.SQL(", ").join(
+            sql.SQL("s.{}").format(sql.Identifier(c)) for c in columns
+        ),
     )
 
-    upsert_sql = sql.SQL(
+    insert_on_conflict = sql.SQL(
         """
         INSERT INTO {master} ({columns})
-        SELECT {columns} FROM {staging}
+        {deduped}
         ON CONFLICT ({pk}) DO UPDATE SET {set_clause}
     """
     ).format(
-        master=sql.Identifier(config["table"]),
-        staging=sql.Identifier(config["staging_table"]),
+        master=master,
+        deduped=deduped,
         columns=col_list,
         pk=pk_list,
-        set_clause=set_clause,
+        set_clause=sql.SQL(", ").join(
+            sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(c)) for c in non_pk_cols
+        ),
+    )
+
+    copy = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, DELIMITER '|', NULL '')")
+    truncate = sql.SQL("TRUNCATE TABLE {}").format(staging)
+    # Freshly truncated staging has no statistics; without them the planner
+    # can pick a nested loop for the upsert join
+    analyze = sql.SQL("ANALYZE {}; ").format(staging)
+
+    return LoadStatements(
+        truncate=truncate,
+        copy=copy.format(staging, col_list),
+        # One simple-query message: libpq runs the TRUNCATE, then enters COPY
+        truncate_and_copy=truncate + sql.SQL("; ") + copy.format(staging, col_list),
+        master_has_rows=_LOAD_SESSION_SQL
+        + sql.SQL("SELECT EXISTS (SELECT 1 FROM {})").format(master),
+        copy_direct=copy.format(master, col_list),
+        merge=_LOAD_SESSION_SQL + analyze + merge,
+        insert_on_conflict=_LOAD_SESSION_SQL + analyze + insert_on_conflict,
+    )
+
+
+def get_statements(config: FileConfig) -> LoadStatements:
+    """Return the composed statements for a file config, building them once."""
+    statements = _STATEMENTS.get(config["table"])
+    if statements is None:
+        statements = _STATEMENTS[config["table"]] = _build_statements(config)
+    return statements
+
+
+def truncate_staging(cur: psycopg2.extensions.cursor, config: FileConfig) -> None:
+    """Truncate the staging table."""
+    cur.execute(get_statements(config).truncate)
+
+
+def copy_to_staging(
+    cur: psycopg2.extensions.cursor,
+    config: FileConfig,
+    buffer: TextIO | BinaryIO | RawIOBase,
+    truncate: bool = False,
+) -> None:
+    """
+    COPY data from buffer into staging table.
+
+    With truncate, the TRUNCATE is sent in the same message as the COPY,
+    saving the round trip of a separate truncate_staging call.
+    """
+    statements = get_statements(config)
+    cur.copy_expert(
+        statements.truncate_and_copy if truncate else statements.copy, buffer
+    )
+
+
+def _stream_copy(
+    cur: psycopg2.extensions.cursor, copy_sql: sql.Composed, reader: CleanedFileReader
+) -> None:
+    """
+    Run a COPY fed from a cleaned file through an OS pipe.
+
+    A producer thread drains the reader into the write end of the pipe
+    while copy_expert sends from the read end, so cleaning the next chunk
+    overlaps with the server consuming the previous one. If COPY fails,
+    closing the read end stops the producer with a broken pipe; an error
+    raised while reading the file is re-raised here once COPY returns.
+    """
+    read_fd, write_fd = os.pipe()
+    errors: list[Exception] = []
+
+    def produce() -> None:
+        try:
+            with os.fdopen(write_fd, "wb") as pipe:
+                shutil.copyfileobj(reader, pipe)
+        except BrokenPipeError:
+            pass  # COPY stopped reading; its own error is raised instead
+        except Exception as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=produce, name="copy-producer", daemon=True)
+    producer.start()
+    try:
+        with os.fdopen(read_fd, "rb") as pipe:
+            cur.copy_expert(copy_sql, pipe)
+    finally:
+        producer.join()
+    if errors:
+        raise errors[0]
+
+
+def stream_to_staging(
+    cur: psycopg2.extensions.cursor,
+    config: FileConfig,
+    reader: CleanedFileReader,
+    truncate: bool = False,
+) -> None:
+    """COPY a cleaned file into the staging table, cleaning while it sends."""
+    statements = get_statements(config)
+    _stream_copy(
+        cur, statements.truncate_and_copy if truncate else statements.copy, reader
     )
 
-    cur.execute(upsert_sql)
+
+def copy_direct_to_master(
+    cur: psycopg2.extensions.cursor, config: FileConfig, filepath: Path
+) -> int | None:
+    """
+    COPY a file straight into its master table if that table is empty.
+
+    An empty table has nothing to merge with, so staging and the upsert
+    would only write every row twice. Returns the number of rows copied,
+    or None when the table already has rows or the file repeats a primary
+    key (which the staging upsert resolves); nothing is written in that
+    case and the caller should load through staging instead.
+    """
+    statements = get_statements(config)
+    cur.execute(statements.master_has_rows)
+    row = cur.fetchone()
+    if row is None or row[0]:
+        return None
+
+    logger.info("  Master table is empty, streaming file directly into it...")
+    cur.execute("SAVEPOINT direct_copy")
+    with CleanedFileReader(filepath) as reader:
+        try:
+            _stream_copy(cur, statements.copy_direct, reader)
+        except psycopg2.errors.UniqueViolation:
+            cur.execute("ROLLBACK TO SAVEPOINT direct_copy")
+            logger.info("  Duplicate keys in file, falling back to staging")
+            return None
+    cur.execute("RELEASE SAVEPOINT direct_copy")
+    return reader.rows
+
+
+def upsert_to_master(cur: psycopg2.extensions.cursor, config: FileConfig) -> int:
+    """
+    Upsert from staging to master table.
+
+    Staging rows are deduplicated on the primary key first (the last copy of
+    a key in the file wins), so a file that repeats a key no longer aborts
+    the load. On PostgreSQL 15+ this is a single MERGE, which the planner can
+    run as one hash join against the master table; older servers fall back
+    to INSERT ... ON CONFLICT.
+
+    Returns number of rows affected.
+    """
+    statements = get_statements(config)
+
+    # rowcount reports the last statement in the batch, i.e. the upsert
+    if cur.connection.server_version >= MERGE_MIN_SERVER_VERSION:
+        cur.execute(statements.merge)
+    else:
+        cur.execute(statements.insert_on_conflict)
     return cur.rowcount
 
 
+def drop_secondary_indexes(
+    cur: psycopg2.extensions.cursor, config: FileConfig
+) -> list[str]:
+    """
+    Drop the master table's non-unique indexes, returning their definitions.
+
+    Uses DROP INDEX CONCURRENTLY, so the cursor's connection must be in
+    autocommit mode. Primary key, unique and constraint-backed indexes are
+    left in place since the upsert and foreign keys depend on them. If a
+    drop fails, the indexes already dropped are rebuilt before re-raising.
+    """
+    cur.execute(
+        """
+        SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        WHERE i.indrelid = %s::regclass
+          AND NOT i.indisunique
+          AND NOT i.indisprimary
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid
+          )
+        """,
+        (config["table"],),
+    )
+    indexes: list[tuple[str, str]] = cur.fetchall()
+    dropped: list[str] = []
+    try:
+        for name, definition in indexes:
+            cur.execute(sql.SQL("DROP INDEX CONCURRENTLY {}").format(sql.SQL(name)))
+            dropped.append(definition)
+    except psycopg2.Error:
+        _create_indexes_concurrently(cur, dropped)
+        raise
+    return dropped
+
+
+def _drop_indexes_for_bulk_load(
+    conn: psycopg2.extensions.connection, config: FileConfig
+) -> list[str]:
+    """
+    Drop the master table's secondary indexes ahead of a bulk load.
+
+    Runs in autocommit before the load transaction opens, so no exclusive
+    lock is held on the master table while the file is copied and
+    upserted. The trade-off: until recreate_indexes has rebuilt them after
+    the load, queries on the table (search included) run without those
+    indexes.
+    """
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            index_defs = drop_secondary_indexes(cur, config)
+    finally:
+        conn.autocommit = False
+    logger.info("  Dropped %d secondary indexes", len(index_defs))
+    return index_defs
+
+
+def _create_indexes_concurrently(
+    cur: psycopg2.extensions.cursor, index_defs: list[str]
+) -> None:
+    """Run index definitions as CREATE INDEX CONCURRENTLY, reporting failures."""
+    for index_def in index_defs:
+        try:
+            cur.execute(
+                index_def.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1)
+            )
+        except psycopg2.Error as e:
+            logger.warning("  WARNING: could not rebuild index (%s): %s", e, index_def)
+
+
+def recreate_indexes(db_config: DbConfig, index_defs: list[str]) -> None:
+    """
+    Rebuild dropped secondary indexes with CREATE INDEX CONCURRENTLY.
+
+    Call once the load has finished, whether it committed or rolled back.
+    Uses an autocommit connection of its own, since CONCURRENTLY cannot run
+    in a transaction block and the load's connection may be broken; the
+    master table stays readable and writable while the indexes build. A
+    failed build is reported and skipped, leaving an invalid index that
+    REINDEX can repair.
+    """
+    if not index_defs:
+        return
+    logger.info("  Rebuilding %d secondary indexes concurrently...", len(index_defs))
+    conn = _acquire_connection(db_config)
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            _create_indexes_concurrently(cur, index_defs)
+    finally:
+        _release_connection(conn, db_config)
+
+
 # =============================================================================
 # MAIN LOADER
 # =============================================================================
 
 
-def load_file(filepath: Path, file_type: str, db_config: DbConfig) -> LoadResult:
-    """Load a single CUSIP file into the database."""
+def load_file(
+    filepath: Path,
+    file_type: str,
+    db_config: DbConfig,
+    bulk_mode: bool | None = None,
+) -> LoadResult:
+    """
+    Load a single CUSIP file into the database.
+
+    bulk_mode overrides the file type's configured bulk_mode: secondary
+    indexes on the master table are dropped before the load transaction
+    and rebuilt concurrently once it ends (see _drop_indexes_for_bulk_load).
+    """
     if file_type not in FILE_CONFIG:
         raise ValueError(f"Unknown file type: {file_type}")
 
     config = FILE_CONFIG[file_type]
-    print(f"\n{'=' * 60}")
-    print(f"Loading {file_type}: {filepath}")
-    print(f"  Target table: {config['table']}")
-    print(f"{'=' * 60}")
-
-    print("  Reading file...")
-    lines = read_and_clean_file(filepath)
-    print(f"  Found {len(lines)} data rows (excluding footer)")
-
-    if not lines:
-        print("  No data rows to load. Skipping.")
-        return {
-            "file": str(filepath),
-            "type": file_type,
-            "rows_read": 0,
-            "rows_upserted": 0,
-            "status": "skipped",
-        }
+    logger.info("\n" + "=" * 60)
+    logger.info("Loading %s: %s", file_type, filepath)
+    logger.info("  Target table: %s", config["table"])
+    logger.info("=" * 60)
 
-    buffer = lines_to_copy_buffer(lines)
+    if bulk_mode is None:
+        bulk_mode = config.get("bulk_mode", False)
 
-    conn = psycopg2.connect(**db_config)
+    conn = _acquire_connection(db_config)
+    rows_read = 0
+    index_defs: list[str] = []
     try:
-        with conn, conn.cursor() as cur:
-            print("  Truncating staging table...")
-            truncate_staging(cur, config)
-
-            print("  COPYing to staging table...")
-            copy_to_staging(cur, config, buffer)
-
-            print("  Upserting to master table...")
-            rows_affected = upsert_to_master(cur, config)
-            print(f"  Upserted {rows_affected} rows")
+        if bulk_mode:
+            index_defs = _drop_indexes_for_bulk_load(conn, config)
 
-        print("  COMMIT successful")
+        with conn, conn.cursor() as cur:
+            direct_rows = None
+            if config.get("direct_copy_if_empty"):
+                direct_rows = copy_direct_to_master(cur, config, filepath)
+
+            if direct_rows is not None:
+                rows_read = rows_affected = direct_rows
+                logger.info("  Copied %d data rows (excluding footer)", rows_read)
+            else:
+                logger.info("  Truncating staging table and streaming file into it...")
+                with CleanedFileReader(filepath) as reader:
+                    stream_to_staging(cur, config, reader, truncate=True)
+                rows_read = reader.rows
+                logger.info("  Found %d data rows (excluding footer)", rows_read)
+
+                rows_affected = 0
+                if rows_read:
+                    logger.info("  Upserting to master table...")
+                    rows_affected = upsert_to_master(cur, config)
+                    logger.info("  Upserted %d rows", rows_affected)
+
+        if not rows_read:
+            logger.info("  No data rows to load. Skipping.")
+            return {
+                "file": str(filepath),
+                "type": file_type,
+                "rows_read": 0,
+                "rows_upserted": 0,
+                "status": "skipped",
+            }
+
+        logger.info("  COMMIT successful")
         return {
             "file": str(filepath),
             "type": file_type,
-            "rows_read": len(lines),
+            "rows_read": rows_read,
             "rows_upserted": rows_affected,
             "status": "success",
         }
 
     except Exception as e:
         conn.rollback()
-        print(f"  ERROR: {e}")
-        print("  ROLLBACK performed")
+        logger.error("  ERROR: %s", e)
+        logger.error("  ROLLBACK performed")
         return {
             "file": str(filepath),
             "type": file_type,
-            "rows_read": len(lines),
+            "rows_read": rows_read,
             "rows_upserted": 0,
             "status": "error",
             "error": str(e),
         }
     finally:
-        conn.close()
+        _release_connection(conn, db_config)
+        recreate_indexes(db_config, index_defs)
+
+
+_FILE_TYPE_BY_LETTER = {"R": "issuer", "E": "issue", "A": "issue_attr"}
 
 
 def detect_file_type(filename: str) -> str | None:
     """Auto-detect file type from CUSIP naming convention."""
-    name = filename.upper()
-    if name.endswith("R.PIP"):
-        return "issuer"
-    elif name.endswith("E.PIP"):
-        return "issue"
-    elif name.endswith("A.PIP"):
-        return "issue_attr"
-    return None
+    if filename[-4:].upper() != ".PIP":
+        return None
+    # The letter before the extension identifies the file
+    return _FILE_TYPE_BY_LETTER.get(filename[-5:-4].upper())
 
 
 def load_from_lines(
-    lines: list[str],
+    lines: Iterable[str],
     file_type: str,
     db_config: DbConfig,
     display_name: str = "<memory>",
@@ -393,17 +911,17 @@ def load_from_lines(
         raise ValueError(f"Unknown file type: {file_type}")
 
     config = FILE_CONFIG[file_type]
-    print(f"\n{'=' * 60}")
-    print(f"Loading {file_type}: {display_name}")
-    print(f"  Target table: {config['table']}")
-    print(f"{'=' * 60}")
+    logger.info("\n" + "=" * 60)
+    logger.info("Loading %s: %s", file_type, display_name)
+    logger.info("  Target table: %s", config["table"])
+    logger.info("=" * 60)
 
-    print("  Cleaning lines...")
-    cleaned_lines = clean_lines(lines)
-    print(f"  Found {len(cleaned_lines)} data rows (excluding footer)")
+    logger.info("  Cleaning lines...")
+    buffer, row_count = clean_lines_to_copy_buffer(lines)
+    logger.info("  Found %d data rows (excluding footer)", row_count)
 
-    if not cleaned_lines:
-        print("  No data rows to load. Skipping.")
+    if not row_count:
+        logger.info("  No data rows to load. Skipping.")
         return {
             "file": display_name,
             "type": file_type,
@@ -412,44 +930,44 @@ def load_from_lines(
             "status": "skipped",
         }
 
-    buffer = lines_to_copy_buffer(cleaned_lines)
-
-    conn = psycopg2.connect(**db_config)
+    conn = _acquire_connection(db_config)
+    index_defs: list[str] = []
     try:
-        with conn, conn.cursor() as cur:
-            print("  Truncating staging table...")
-            truncate_staging(cur, config)
+        if config.get("bulk_mode"):
+            index_defs = _drop_indexes_for_bulk_load(conn, config)
 
-            print("  COPYing to staging table...")
-            copy_to_staging(cur, config, buffer)
+        with conn, conn.cursor() as cur:
+            logger.info("  Truncating staging table and COPYing into it...")
+            copy_to_staging(cur, config, buffer, truncate=True)
 
-            print("  Upserting to master table...")
+            logger.info("  Upserting to master table...")
             rows_affected = upsert_to_master(cur, config)
-            print(f"  Upserted {rows_affected} rows")
+            logger.info("  Upserted %d rows", rows_affected)
 
-        print("  COMMIT successful")
+        logger.info("  COMMIT successful")
         return {
             "file": display_name,
             "type": file_type,
-            "rows_read": len(cleaned_lines),
+            "rows_read": row_count,
             "rows_upserted": rows_affected,
             "status": "success",
         }
 
     except Exception as e:
         conn.rollback()
-        print(f"  ERROR: {e}")
-        print("  ROLLBACK performed")
+        logger.error("  ERROR: %s", e)
+        logger.error("  ROLLBACK performed")
         return {
             "file": display_name,
             "type": file_type,
-            "rows_read": len(cleaned_lines),
+            "rows_read": row_count,
             "rows_upserted": 0,
             "status": "error",
             "error": str(e),
         }
     finally:
-        conn.close()
+        _release_connection(conn, db_config)
+        recreate_indexes(db_config, index_defs)
 
 
 def load_from_source(
@@ -457,6 +975,7 @@ def load_from_source(
     file_type: str,
     db_config: DbConfig,
     file_source: LocalFileSource | S3FileSource,
+    bulk_mode: bool | None = None,
 ) -> LoadResult:
     """
     Load a CUSIP file using the file source abstraction.
@@ -469,16 +988,225 @@ def load_from_source(
         file_type: Type of file ('issuer', 'issue', 'issue_attr')
         db_config: Database connection configuration
         file_source: File source instance for reading the file
+        bulk_mode: Override the file type's configured bulk_mode
 
     Returns:
         LoadResult with status and row counts
     """
-    print(f"  Reading from {file_info.source}: {file_info.display_path}")
-    raw_lines = file_source.read_file(file_info)
+    if file_info.source == "local" and file_info.local_path is not None:
+        # Local files stream straight into the COPY buffer
+        return load_file(file_info.local_path, file_type, db_config, bulk_mode)
 
-    return load_from_lines(
-        lines=raw_lines,
-        file_type=file_type,
-        db_config=db_config,
-        display_name=file_info.display_path,
-    )
+    # Other sources are fetched as raw bytes and cleaned without decoding
+    logger.info("  Reading from %s: %s", file_info.source, file_info.display_path)
+    content = file_source.read_bytes(file_info)
+    return load_files(
+        [(file_type, content, file_info.display_path)], db_config, bulk_mode
+    )[0]
+
+
+# A local file to stream into COPY, raw contents already fetched (e.g. from
+# S3), or lines already read from a source
+LoadSource = Path | bytes | Iterable[str]
+
+
+@dataclass
+class _StagedLoad:
+    """A file COPYed into its staging table, transaction still open."""
+
+    file_type: str
+    display_name: str
+    conn: psycopg2.extensions.connection
+    db_config: DbConfig
+    rows: int
+    # Bulk mode: secondary indexes dropped before staging, to rebuild
+    index_defs: list[str]
+
+
+def _stage_load(
+    file_type: str,
+    source: LoadSource,
+    display_name: str,
+    db_config: DbConfig,
+    bulk_mode: bool,
+) -> _StagedLoad | LoadResult:
+    """TRUNCATE and COPY one file into staging on its own connection."""
+    config = FILE_CONFIG[file_type]
+    conn = _acquire_connection(db_config)
+    rows = 0
+    index_defs: list[str] = []
+    try:
+        if bulk_mode:
+            index_defs = _drop_indexes_for_bulk_load(conn, config)
+        with conn.cursor() as cur:
+            if isinstance(source, Path | bytes):
+                with CleanedFileReader(source) as reader:
+                    stream_to_staging(cur, config, reader, truncate=True)
+                rows = reader.rows
+            else:
+                buffer, rows = clean_lines_to_copy_buffer(source)
+                copy_to_staging(cur, config, buffer, truncate=True)
+    except Exception as e:
+        conn.rollback()
+        _release_connection(conn, db_config)
+        recreate_indexes(db_config, index_defs)
+        logger.error("  [%s] ERROR while staging %s: %s", file_type, display_name, e)
+        return {
+            "file": display_name,
+            "type": file_type,
+            "rows_read": rows,
+            "rows_upserted": 0,
+            "status": "error",
+            "error": str(e),
+        }
+
+    logger.info("  [%s] Staged %d data rows from %s", file_type, rows, display_name)
+    return _StagedLoad(file_type, display_name, conn, db_config, rows, index_defs)
+
+
+def _finish_load(staged: _StagedLoad) -> LoadResult:
+    """Upsert a staged file into its master table and commit."""
+    config = FILE_CONFIG[staged.file_type]
+    conn = staged.conn
+    result: LoadResult = {
+        "file": staged.display_name,
+        "type": staged.file_type,
+        "rows_read": staged.rows,
+        "rows_upserted": 0,
+    }
+    try:
+        if not staged.rows:
+            conn.rollback()
+            logger.info("  [%s] No data rows to load. Skipping.", staged.file_type)
+            result["rows_read"] = 0
+            result["status"] = "skipped"
+            return result
+
+        with conn, conn.cursor() as cur:
+            rows_affected = upsert_to_master(cur, config)
+
+        logger.info(
+            "  [%s] Upserted %d rows, COMMIT successful",
+            staged.file_type,
+            rows_affected,
+        )
+        result["rows_upserted"] = rows_affected
+        result["status"] = "success"
+        return result
+
+    except Exception as e:
+        logger.error("  [%s] ERROR: %s", staged.file_type, e)
+        logger.error("  [%s] ROLLBACK performed", staged.file_type)
+        result["status"] = "error"
+        result["error"] = str(e)
+        return result
+    finally:
+        _release_connection(conn, staged.db_config)
+        recreate_indexes(staged.db_config, staged.index_defs)
+
+
+def load_files(
+    sources: list[tuple[str, LoadSource, str]],
+    db_config: DbConfig,
+    bulk_mode: bool | None = None,
+) -> list[LoadResult]:
+    """
+    Load several files, staging them concurrently and committing in order.
+
+    Each file gets its own connection and transaction. TRUNCATE + COPY into
+    the staging tables runs in parallel; the upserts then run and commit one
+    at a time in the order given, so pass files in foreign key order
+    (issuer, issue, issue_attr). Under READ COMMITTED each upsert sees the
+    rows committed before it. If a load fails, the remaining staged loads
+    are rolled back and left out of the results.
+
+    Args:
+        sources: (file_type, local path, raw contents or lines, display
+            name) per file, at most one per file type
+        db_config: Database connection configuration
+        bulk_mode: Override each file type's configured bulk_mode
+
+    Returns:
+        LoadResult per attempted file, in the order given
+    """
+    file_types = [file_type for file_type, _, _ in sources]
+    for file_type in file_types:
+        if file_type not in FILE_CONFIG:
+            raise ValueError(f"Unknown file type: {file_type}")
+    if len(set(file_types)) != len(file_types):
+        # Two loads of one type would wait on each other's staging TRUNCATE
+        raise ValueError("load_files accepts at most one file per type")
+    if not sources:
+        return []
+
+    logger.info("\nStaging %d file(s)...", len(sources))
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [
+            executor.submit(
+                _stage_load,
+                file_type,
+                source,
+                name,
+                db_config,
+                FILE_CONFIG[file_type].get("bulk_mode", False)
+                if bulk_mode is None
+                else bulk_mode,
+            )
+            for file_type, source, name in sources
+        ]
+
+    staged: list[_StagedLoad | LoadResult] = []
+    first_error: BaseException | None = None
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            first_error = first_error or error
+        else:
+            staged.append(future.result())
+    if first_error is not None:
+        for item in staged:
+            if isinstance(item, _StagedLoad):
+                item.conn.close()
+                recreate_indexes(item.db_config, item.index_defs)
+        raise first_error
+
+    results: list[LoadResult] = []
+    for item in staged:
+        if results and results[-1].get("status") == "error":
+            # Stop after a failure to prevent FK violations
+            if isinstance(item, _StagedLoad):
+                item.conn.rollback()
+                _release_connection(item.conn, item.db_config)
+                recreate_indexes(item.db_config, item.index_defs)
+            continue
+        results.append(_finish_load(item) if isinstance(item, _StagedLoad) else item)
+
+    return results
+
+
+def refresh_security_summary(db_config: DbConfig) -> bool:
+    """
+    Refresh mv_security_summary after the master tables have changed.
+
+    Uses REFRESH ... CONCURRENTLY so readers of the materialized view are not
+    blocked while it is rebuilt.
+
+    Args:
+        db_config: Database connection configuration
+
+    Returns:
+        True if the refresh succeeded, False otherwise
+    """
+    logger.info("\nRefreshing mv_security_summary...")
+    conn = _acquire_connection(db_config)
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_security_summary")
+        logger.info("  Refresh successful")
+        return True
+
+    except psycopg2.Error as e:
+        logger.error("  ERROR: %s", e)
+        return False
+    finally:
+        _release_connection(conn, db_config)
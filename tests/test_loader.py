@@ -0,0 +1,57 @@
+"""Tests for PIP file cleaning."""
+
+from __future__ import annotations
+
+from io import BytesIO, TextIOWrapper
+
+import pytest
+
+from cusipservice.loader import CleanedFileReader, clean_lines
+
+SAMPLE = (
+    b"000001|ACME CORP|NY\r\n"
+    b"\r\n"
+    b"000002|BETA \xff\xfe INDUSTRIES|CA\r\n"
+    b"\n"
+    b"000003|CAF\xc3\xa9 HOLDINGS|\xe2\x82\xac\n"
+    b"000004|TRUNCATED \xe2\x82|TX\x1a\n"
+    b"999999|TRAILER RECORD|0000000004\r\n"
+    b"\x1a"
+)
+
+
+def _expected(data: bytes) -> bytes:
+    """Clean data the way clean_lines does for a local file."""
+    raw_lines = TextIOWrapper(BytesIO(data), encoding="utf-8", errors="replace")
+    return "".join(f"{line}\n" for line in clean_lines(raw_lines)).encode()
+
+
+def _read_all(reader: CleanedFileReader) -> bytes:
+    with reader:
+        return reader.read()
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(SAMPLE) + 2))
+def test_reader_matches_clean_lines(chunk_size: int) -> None:
+    reader = CleanedFileReader(SAMPLE, chunk_size=chunk_size)
+
+    assert _read_all(reader) == _expected(SAMPLE)
+    assert reader.rows == 4
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x1a",
+        b"\r\n\r\n",
+        b"999999|TRAILER ONLY\r\n",
+        b"000001|NO TRAILING NEWLINE",
+        b"000001|LAST LINE IS THE TRAILER\n999999|NO NEWLINE",
+    ],
+)
+def test_reader_matches_clean_lines_edge_cases(data: bytes) -> None:
+    for chunk_size in range(1, len(data) + 2):
+        reader = CleanedFileReader(data, chunk_size=chunk_size)
+
+        assert _read_all(reader) == _expected(data), chunk_size